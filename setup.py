@@ -18,17 +18,21 @@ setup(
     package_dir={"": "src"},
     python_requires=">=3.9",
     install_requires=[
-        "pydantic>=2.0.0",
+        "pydantic>=2.6.0",
         "pyyaml>=6.0",
     ],
     extras_require={
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
+            "pytest-benchmark>=4.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.5.0",
         ],
+        "fast": [
+            "orjson>=3.8.0",
+        ],
     },
     classifiers=[
         "Development Status :: 3 - Alpha",
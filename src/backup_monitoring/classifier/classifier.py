@@ -1,8 +1,9 @@
 """Backup classification module."""
 
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from backup_monitoring.config.config_loader import get_config
 from backup_monitoring.classifier.rules import (
     ClassificationRule,
@@ -11,12 +12,41 @@ from backup_monitoring.classifier.rules import (
 )
 from backup_monitoring.data_loader.models import BackupRecord
 
+# Prefer the libyaml-backed loader; it is a drop-in replacement for SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ClassificationError(Exception):
     """Exception raised when classification fails."""
     pass
 
 
+@lru_cache(maxsize=8)
+def _load_rules_cached(path: str, mtime_ns: int, size: int) -> Tuple[ClassificationRule, ...]:
+    """
+    Parse a classification rules file.
+    
+    Cached on the file's modification time and size as well as its path, so
+    an edited file is parsed again without explicit invalidation. The cached
+    rules are shared, so callers must hand out copies of them.
+    
+    Args:
+        path: Resolved path to the rules YAML file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        
+    Returns:
+        Tuple of classification rules
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        rules_data = yaml.load(f, Loader=_YamlLoader)
+    
+    return tuple(ClassificationRules(**rules_data).rules)
+
+
 class BackupClassifier:
     """Classifies backup records into logical backup types."""
     
@@ -51,11 +81,10 @@ class BackupClassifier:
                 raise FileNotFoundError(f"Classification rules file not found: {rules_path}")
             
             try:
-                with open(rules_path, 'r', encoding='utf-8') as f:
-                    rules_data = yaml.safe_load(f)
-                
-                rules_collection = ClassificationRules(**rules_data)
-                self._rules = rules_collection.rules
+                stat = rules_path.stat()
+                rules = _load_rules_cached(str(rules_path.resolve()), stat.st_mtime_ns, stat.st_size)
+                # Copy so one classifier's changes do not leak into others
+                self._rules = [rule.model_copy(deep=True) for rule in rules]
             except Exception as e:
                 raise ClassificationError(f"Failed to load classification rules: {e}") from e
         
@@ -91,27 +120,18 @@ class BackupClassifier:
             BackupRecord with backup_type set
         """
         # If backup_type is already set and not None, keep it
-        if record.backup_type is not None and record.backup_type != self.default_backup_type:
+        if self._has_explicit_type(record):
             return record
         
-        # Apply classification rules
-        evaluator = self._get_evaluator()
-        backup_type = evaluator.classify(record)
-        
-        # Use default if no rule matched
-        if backup_type is None:
-            backup_type = self.default_backup_type
-        
-        # Create a new record with the classified type
-        record_dict = record.model_dump()
-        record_dict['backup_type'] = backup_type
-        
-        return BackupRecord(**record_dict)
+        return self._apply_rules(record, self._get_evaluator())
     
     def classify_batch(self, records: List[BackupRecord]) -> List[BackupRecord]:
         """
         Classify a batch of backup records.
         
+        The rule evaluator is resolved once for the whole batch rather than
+        once per record.
+        
         Args:
             records: List of BackupRecord objects to classify
             
@@ -119,15 +139,39 @@ class BackupClassifier:
             List of classified BackupRecord objects
         """
         evaluator = self._get_evaluator()
-        classified = []
         
-        for record in records:
-            classified_record = self.classify(record)
-            classified.append(classified_record)
+        return [
+            record if self._has_explicit_type(record) else self._apply_rules(record, evaluator)
+            for record in records
+        ]
+    
+    def _has_explicit_type(self, record: BackupRecord) -> bool:
+        """Whether the record carries a backup_type that classification must keep."""
+        return record.backup_type is not None and record.backup_type != self.default_backup_type
+    
+    def _apply_rules(self, record: BackupRecord, evaluator: RuleEvaluator) -> BackupRecord:
+        """
+        Apply classification rules to a record.
+        
+        Args:
+            record: BackupRecord to classify
+            evaluator: Rule evaluator to use
+            
+        Returns:
+            Copy of the record with backup_type set
+        """
+        backup_type = evaluator.classify(record)
+        
+        # Use default if no rule matched
+        if backup_type is None:
+            backup_type = self.default_backup_type
         
-        return classified
+        # The record was validated on creation and only backup_type changes,
+        # so copy it instead of re-running full model validation
+        return record.model_copy(update={'backup_type': backup_type})
     
     def reload_rules(self) -> None:
         """Reload classification rules from file."""
+        _load_rules_cached.cache_clear()
         self._rules = None
         self._evaluator = None
@@ -1,6 +1,8 @@
 """Classification rules models and evaluation."""
 
-from typing import List, Dict, Any, Optional
+import re
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from enum import Enum
 from pydantic import BaseModel, Field
 
@@ -37,6 +39,129 @@ class ClassificationRules(BaseModel):
     rules: List[ClassificationRule] = Field(default_factory=list, description="List of classification rules")
 
 
+# Operators that compare the string form of the field value
+_STRING_OPERATORS = frozenset({
+    Operator.CONTAINS,
+    Operator.NOT_CONTAINS,
+    Operator.STARTS_WITH,
+    Operator.ENDS_WITH,
+})
+
+
+def _check_in(field_value: Any, operand: Optional[list]) -> bool:
+    """Membership check; a non-list rule value never matches."""
+    return operand is not None and field_value in operand
+
+
+# Comparison for each operator, called as check(field_value, operand)
+_OPERATOR_CHECKS = {
+    Operator.EQUALS: lambda field_value, operand: field_value == operand,
+    Operator.NOT_EQUALS: lambda field_value, operand: field_value != operand,
+    Operator.CONTAINS: lambda field_value, operand: operand in field_value,
+    Operator.NOT_CONTAINS: lambda field_value, operand: operand not in field_value,
+    Operator.STARTS_WITH: str.startswith,
+    Operator.ENDS_WITH: str.endswith,
+    Operator.IN: _check_in,
+    Operator.REGEX: lambda field_value, operand: operand.search(field_value) is not None,
+}
+
+
+class _PreparedCondition:
+    """A condition with its field path and operand resolved once at load time."""
+    
+    __slots__ = ("path", "operator", "check", "operand", "as_string", "fold_case", "in_union")
+    
+    # Comparison for the operator, called as check(field_value, operand)
+    check: Callable[[Any, Any], bool]
+    # Rule value prepared for the operator: a string, compiled pattern, list or raw value
+    operand: Any
+    
+    def __init__(self, condition: Condition):
+        """
+        Prepare a condition for repeated evaluation.
+        
+        Args:
+            condition: Condition to prepare
+        """
+        operator = condition.operator
+        self.path: Tuple[str, ...] = tuple(condition.field.split('.'))
+        self.operator = operator
+        self.check = _OPERATOR_CHECKS[operator]
+        self.as_string = operator in _STRING_OPERATORS or operator == Operator.REGEX
+        self.fold_case = operator in _STRING_OPERATORS and not condition.case_sensitive
+        self.in_union = False
+        
+        if operator in _STRING_OPERATORS:
+            operand = str(condition.value)
+            self.operand = operand.lower() if self.fold_case else operand
+        elif operator == Operator.REGEX:
+            flags = 0 if condition.case_sensitive else re.IGNORECASE
+            self.operand = re.compile(str(condition.value), flags)
+        elif operator == Operator.IN:
+            self.operand = condition.value if isinstance(condition.value, list) else None
+        else:
+            self.operand = condition.value
+
+
+# Inline flag group that applies to the whole pattern, e.g. "(?x)". Before
+# Python 3.11 such a group inside an alternative only warns and then applies
+# to the whole union, so patterns containing one are never combined.
+_GLOBAL_INLINE_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+def _can_combine(pattern: re.Pattern) -> bool:
+    """Whether a compiled regex can be nested in a union without changing its meaning."""
+    return (
+        pattern.groups == 0
+        and not pattern.flags & ~(re.IGNORECASE | re.UNICODE)
+        and _GLOBAL_INLINE_FLAGS.search(pattern.pattern) is None
+    )
+
+
+def _build_regex_unions(conditions: List[_PreparedCondition]) -> Dict[Tuple[str, ...], re.Pattern]:
+    """
+    Combine the regex conditions on each field into one alternation pattern.
+    
+    A search with the union finds nothing exactly when none of the combined
+    patterns match, so one search per field can rule out all of that field's
+    regex conditions at once. Only fields with several regex conditions get a
+    union. Patterns with groups are left out since wrapping them would
+    renumber backreferences, as are patterns with flags other than
+    IGNORECASE, which cannot be scoped to one alternative. Conditions that
+    are combined get in_union set.
+    
+    Args:
+        conditions: Prepared conditions of all rules
+        
+    Returns:
+        Dictionary mapping field path to the compiled union pattern
+    """
+    by_path: Dict[Tuple[str, ...], List[_PreparedCondition]] = {}
+    for condition in conditions:
+        if condition.operator == Operator.REGEX and _can_combine(condition.operand):
+            by_path.setdefault(condition.path, []).append(condition)
+    
+    unions = {}
+    for path, regex_conditions in by_path.items():
+        if len(regex_conditions) < 2:
+            continue
+        
+        parts = []
+        for condition in regex_conditions:
+            flags = "i" if condition.operand.flags & re.IGNORECASE else ""
+            parts.append(f"(?{flags}:{condition.operand.pattern})")
+        
+        try:
+            unions[path] = re.compile("|".join(parts))
+        except re.error:
+            continue
+        
+        for condition in regex_conditions:
+            condition.in_union = True
+    
+    return unions
+
+
 class RuleEvaluator:
     """Evaluates classification rules against backup records."""
     
@@ -49,23 +174,61 @@ class RuleEvaluator:
         """
         self.rules = rules
     
-    def _get_field_value(self, record: Dict[str, Any], field: str) -> Any:
+    @cached_property
+    def _prepared(self) -> Tuple[
+        Tuple[Tuple[str, List[_PreparedCondition]], ...],
+        Optional[str],
+        Dict[Tuple[str, ...], re.Pattern],
+    ]:
+        """
+        Prepared rules and the catch-all backup type, built on first use.
+        
+        Conditions are prepared once per evaluator (field paths split, case
+        folding applied to rule values, regex patterns compiled and combined
+        per field) so that classification only does the per-record work.
+        
+        Returns:
+            Tuple of (prepared rules as (backup type, conditions),
+            backup type of the first rule without conditions or None,
+            regex union pattern per field path)
         """
-        Get field value from record, supporting dot notation for nested fields.
+        prepared_rules = []
+        default_type = None
+        
+        for rule in self.rules:
+            if not rule.conditions:
+                # A rule without conditions matches every record, so rules
+                # after it can never be reached
+                default_type = rule.backup_type
+                break
+            
+            conditions = [_PreparedCondition(condition) for condition in rule.conditions]
+            prepared_rules.append((rule.backup_type, conditions))
+        
+        regex_unions = _build_regex_unions(
+            [condition for _, conditions in prepared_rules for condition in conditions]
+        )
+        
+        return tuple(prepared_rules), default_type, regex_unions
+    
+    def _get_field_value(self, record: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+        """
+        Get field value from record, following a pre-split nested field path.
         
         Args:
             record: Backup record dictionary
-            field: Field name (supports dot notation like "metadata.key")
+            path: Field path parts (e.g. ("metadata", "key") for "metadata.key")
             
         Returns:
             Field value or None if not found
         """
-        parts = field.split('.')
-        value = record
+        value: Any = record
         
-        for part in parts:
+        for part in path:
             if isinstance(value, dict):
                 value = value.get(part)
+            elif isinstance(value, BaseModel):
+                value = value.__dict__.get(part)
             else:
                 return None
             
@@ -74,62 +237,60 @@ class RuleEvaluator:
         
         return value
     
-    def _evaluate_condition(self, condition: Condition, record: Dict[str, Any]) -> bool:
+    def _evaluate_condition(self, condition: _PreparedCondition, record: Dict[str, Any]) -> bool:
         """
-        Evaluate a single condition against a record.
+        Evaluate a single prepared condition against a record.
         
         Args:
-            condition: Condition to evaluate
+            condition: Prepared condition to evaluate
             record: Backup record dictionary
             
         Returns:
             True if condition matches, False otherwise
         """
-        field_value = self._get_field_value(record, condition.field)
+        field_value = self._get_field_value(record, condition.path)
         
         if field_value is None:
             return False
         
         # Convert to string for string operations if needed
-        if condition.operator in [Operator.CONTAINS, Operator.STARTS_WITH, Operator.ENDS_WITH]:
+        if condition.as_string:
             field_value = str(field_value)
-            compare_value = str(condition.value)
-            
-            if not condition.case_sensitive:
+            if condition.fold_case:
                 field_value = field_value.lower()
-                compare_value = compare_value.lower()
-        
-        # Evaluate based on operator
-        if condition.operator == Operator.EQUALS:
-            return field_value == condition.value
-        
-        elif condition.operator == Operator.NOT_EQUALS:
-            return field_value != condition.value
         
-        elif condition.operator == Operator.CONTAINS:
-            return compare_value in field_value
-        
-        elif condition.operator == Operator.NOT_CONTAINS:
-            return compare_value not in field_value
-        
-        elif condition.operator == Operator.STARTS_WITH:
-            return field_value.startswith(compare_value)
-        
-        elif condition.operator == Operator.ENDS_WITH:
-            return field_value.endswith(compare_value)
+        return condition.check(field_value, condition.operand)
+    
+    def _union_matches(
+        self,
+        regex_unions: Dict[Tuple[str, ...], re.Pattern],
+        union_matches: Dict[Tuple[str, ...], bool],
+        record: Dict[str, Any],
+        path: Tuple[str, ...]
+    ) -> bool:
+        """
+        Whether any regex combined for a field matches the record, memoized per record.
         
-        elif condition.operator == Operator.IN:
-            if isinstance(condition.value, list):
-                return field_value in condition.value
-            return False
+        Args:
+            regex_unions: Regex union pattern per field path
+            union_matches: Results already computed for this record
+            record: Backup record dictionary
+            path: Field path of the union
+            
+        Returns:
+            False if none of the field's combined regex conditions can match
+        """
+        matched = union_matches.get(path)
         
-        elif condition.operator == Operator.REGEX:
-            import re
-            flags = 0 if condition.case_sensitive else re.IGNORECASE
-            pattern = str(condition.value)
-            return bool(re.search(pattern, str(field_value), flags))
+        if matched is None:
+            field_value = self._get_field_value(record, path)
+            matched = (
+                field_value is not None
+                and regex_unions[path].search(str(field_value)) is not None
+            )
+            union_matches[path] = matched
         
-        return False
+        return matched
     
     def classify(self, record: Dict[str, Any]) -> Optional[str]:
         """
@@ -138,23 +299,35 @@ class RuleEvaluator:
         Rules are evaluated in order, and the first matching rule's backup_type is returned.
         
         Args:
-            record: Backup record dictionary (can be BackupRecord model_dict or plain dict)
+            record: Backup record dictionary or BackupRecord model
             
         Returns:
             Backup type string, or None if no rule matches
         """
-        # Convert Pydantic model to dict if needed
-        if hasattr(record, 'model_dump'):
-            record_dict = record.model_dump()
+        # Read a Pydantic model's field values in place instead of dumping a copy
+        if isinstance(record, BaseModel):
+            record_dict = record.__dict__
         elif hasattr(record, 'dict'):
             record_dict = record.dict()
         else:
             record_dict = record
         
+        prepared_rules, default_type, regex_unions = self._prepared
+        
+        # Per-field regex union results for this record, searched on first need
+        union_matches: Dict[Tuple[str, ...], bool] = {}
+        
         # Evaluate rules in order
-        for rule in self.rules:
+        for backup_type, conditions in prepared_rules:
             # All conditions must match (AND logic)
-            if all(self._evaluate_condition(condition, record_dict) for condition in rule.conditions):
-                return rule.backup_type
+            if all(
+                (
+                    not condition.in_union
+                    or self._union_matches(regex_unions, union_matches, record_dict, condition.path)
+                )
+                and self._evaluate_condition(condition, record_dict)
+                for condition in conditions
+            ):
+                return backup_type
         
-        return None
+        return default_type
@@ -2,10 +2,17 @@
 
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, TextIO
 from pydantic import BaseModel, Field
 
+# Prefer the libyaml-backed loader; it is a drop-in replacement for SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 class AppConfig(BaseModel):
     """Application configuration."""
@@ -68,6 +75,43 @@ class SystemConfig(BaseModel):
     integration: IntegrationConfig
 
 
+def _parse_config(stream: TextIO) -> SystemConfig:
+    """
+    Parse and validate configuration YAML from an open text stream.
+    
+    Args:
+        stream: Text stream with the YAML configuration
+        
+    Returns:
+        SystemConfig: Validated configuration object
+    """
+    config_data = yaml.load(stream, Loader=_YamlLoader)
+    
+    # Validate and create config object
+    return SystemConfig(**config_data)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> SystemConfig:
+    """
+    Parse and validate a configuration file.
+    
+    Cached on the file's modification time and size as well as its path, so
+    an edited file is parsed again without explicit invalidation. The cached
+    instance is shared, so callers must hand out copies of it.
+    
+    Args:
+        path: Resolved path to the configuration file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        
+    Returns:
+        SystemConfig: Validated configuration object
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return _parse_config(f)
+
+
 class ConfigLoader:
     """Loads and validates configuration from YAML files."""
     
@@ -112,11 +156,28 @@ class ConfigLoader:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
+        stat = self.config_path.stat()
+        cached = _load_config_cached(
+            str(self.config_path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+        # Copy so one loader's changes do not leak into other loaders of the file
+        self._config = cached.model_copy(deep=True)
+        return self._config
+    
+    def load_from_stream(self, stream: TextIO) -> SystemConfig:
+        """
+        Load configuration from an open text stream instead of the config file.
         
-        # Validate and create config object
-        self._config = SystemConfig(**config_data)
+        Args:
+            stream: Text stream with the YAML configuration (e.g. io.StringIO)
+            
+        Returns:
+            SystemConfig: Validated configuration object
+            
+        Raises:
+            ValueError: If config is invalid
+        """
+        self._config = _parse_config(stream)
         return self._config
     
     def get_config(self) -> SystemConfig:
@@ -135,6 +196,7 @@ class ConfigLoader:
     
     def reload(self) -> SystemConfig:
         """Reload configuration from file."""
+        _load_config_cached.cache_clear()
         return self.load()
 
 
@@ -1,15 +1,71 @@
 """JSON data loader for backup metadata."""
 
 import json
+import sys
 import jsonschema
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-import pytz
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
 
 from backup_monitoring.config.config_loader import get_config
 from backup_monitoring.data_loader.models import BackupRecord, BackupStatus
 
+# orjson is an optional, faster parser (install the "fast" extra); its
+# JSONDecodeError subclasses json.JSONDecodeError
+_json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Fixed-offset UTC; unlike a tz database zone it needs no DST lookups
+_UTC = timezone.utc
+
+# Timestamp formats tried after ISO 8601 and the configured date format
+_FALLBACK_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S.%f",
+)
+
+
+def _is_iso_date_shaped(timestamp_str: str) -> bool:
+    """Whether the string starts like an ISO 8601 extended date (YYYY-MM-DD)."""
+    return len(timestamp_str) >= 10 and timestamp_str[4] == '-' and timestamp_str[7] == '-'
+
+
+def _parse_iso(timestamp_str: str) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp, returning None if it is not valid ISO."""
+    # fromisoformat only accepts a trailing 'Z' from Python 3.11 on
+    if timestamp_str.endswith('Z'):
+        timestamp_str = timestamp_str[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(timestamp_str)
+    except ValueError:
+        return None
+
+
+def _parse_with_formats(timestamp_str: str, formats: Tuple[str, ...]) -> Optional[datetime]:
+    """Parse a timestamp with the first matching strptime format, or return None."""
+    for fmt in formats:
+        try:
+            return datetime.strptime(timestamp_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+# Status lookup by value, avoiding BackupStatus(value) enum construction per record
+_STATUSES = {status.value: status for status in BackupStatus}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a string value, passing None and non-strings through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
 
 class JSONLoadError(Exception):
     """Exception raised when JSON loading fails."""
@@ -38,9 +94,11 @@ class JSONDataLoader:
         """
         self.config = get_config(config_path)
         self.schema_path = Path(self.config.data_loader.json_schema_path)
-        self.default_timezone = pytz.timezone(self.config.data_loader.default_timezone)
+        timezone_name = self.config.data_loader.default_timezone
+        self.default_timezone = _UTC if timezone_name.upper() == "UTC" else ZoneInfo(timezone_name)
         self.date_format = self.config.data_loader.date_format
         self._schema: Optional[Dict[str, Any]] = None
+        self._validator: Optional[jsonschema.protocols.Validator] = None
     
     def _load_schema(self) -> Dict[str, Any]:
         """Load JSON schema from file."""
@@ -89,42 +147,24 @@ class JSONDataLoader:
         Raises:
             TimestampNormalizationError: If timestamp cannot be parsed
         """
-        # Try ISO format first (most common)
-        try:
-            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            # If timezone-naive, assume UTC
-            if dt.tzinfo is None:
-                dt = self.default_timezone.localize(dt)
-            return dt
-        except ValueError:
-            pass
+        formats = (self.date_format, *_FALLBACK_FORMATS)
         
-        # Try custom format from config
-        try:
-            dt = datetime.strptime(timestamp_str, self.date_format)
-            # Assume UTC if timezone-naive
+        # Try ISO format first (most common) when the string is shaped like
+        # YYYY-MM-DD...; other strings go straight to the strptime formats
+        # instead of raising inside fromisoformat first
+        if _is_iso_date_shaped(timestamp_str):
+            dt = _parse_iso(timestamp_str)
+            if dt is None:
+                dt = _parse_with_formats(timestamp_str, formats)
+        else:
+            # fromisoformat still gets the last word (e.g. compact ISO forms)
+            dt = _parse_with_formats(timestamp_str, formats) or _parse_iso(timestamp_str)
+        
+        if dt is not None:
+            # If timezone-naive, assume the default timezone
             if dt.tzinfo is None:
-                dt = self.default_timezone.localize(dt)
+                dt = dt.replace(tzinfo=self.default_timezone)
             return dt
-        except ValueError:
-            pass
-        
-        # Try common formats
-        formats = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S.%f",
-            "%Y-%m-%d %H:%M:%S.%f",
-        ]
-        
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(timestamp_str, fmt)
-                if dt.tzinfo is None:
-                    dt = self.default_timezone.localize(dt)
-                return dt
-            except ValueError:
-                continue
         
         raise TimestampNormalizationError(
             f"Unable to parse timestamp: {timestamp_str}"
@@ -149,25 +189,52 @@ class JSONDataLoader:
         end_time = self._normalize_timestamp(raw_record['end_time'])
         
         # Normalize status
-        status_str = raw_record['status'].lower()
-        try:
-            status = BackupStatus(status_str)
-        except ValueError:
+        status = _STATUSES.get(raw_record['status'].lower())
+        if status is None:
             raise ValueError(f"Invalid status value: {raw_record['status']}")
         
-        # Build normalized record
+        # Build normalized record; the low-cardinality strings are interned
+        # so records loaded from the same source share them
         normalized = BackupRecord(
             backup_id=str(raw_record['backup_id']),
             start_time=start_time,
             end_time=end_time,
             status=status,
-            backup_type=raw_record.get('backup_type'),
-            source_system=raw_record.get('source_system'),
+            backup_type=_intern(raw_record.get('backup_type')),
+            source_system=_intern(raw_record.get('source_system')),
             metadata=raw_record.get('metadata', {})
         )
         
         return normalized
     
+    def _normalize_records(self, data: List[Dict[str, Any]]) -> List[BackupRecord]:
+        """
+        Normalize schema-validated raw records, collecting per-record errors.
+        
+        Args:
+            data: List of raw backup record dictionaries
+            
+        Returns:
+            List[BackupRecord]: List of normalized backup records
+            
+        Raises:
+            JSONLoadError: If any record cannot be normalized
+        """
+        normalized_records = []
+        errors = []
+        
+        for idx, raw_record in enumerate(data):
+            try:
+                normalized_records.append(self._normalize_record(raw_record))
+            except Exception as e:
+                errors.append(f"Record {idx} (backup_id: {raw_record.get('backup_id', 'unknown')}): {e}")
+        
+        if errors:
+            error_msg = f"Failed to normalize {len(errors)} record(s):\n" + "\n".join(errors)
+            raise JSONLoadError(error_msg)
+        
+        return normalized_records
+    
     def validate_schema(self, data: List[Dict[str, Any]]) -> None:
         """
         Validate data against JSON schema.
@@ -178,14 +245,38 @@ class JSONDataLoader:
         Raises:
             SchemaValidationError: If validation fails
         """
-        schema = self._load_schema()
+        validator = self._get_validator()
         
-        try:
-            jsonschema.validate(instance=data, schema=schema)
-        except jsonschema.ValidationError as e:
-            raise SchemaValidationError(f"Schema validation failed: {e.message}") from e
-        except jsonschema.SchemaError as e:
-            raise SchemaValidationError(f"Invalid schema: {e.message}") from e
+        # Report the most relevant error, as jsonschema.validate() does
+        error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+        if error is not None:
+            raise SchemaValidationError(f"Schema validation failed: {error.message}") from error
+    
+    def _get_validator(self) -> jsonschema.protocols.Validator:
+        """
+        Get or create the validator for the JSON schema.
+        
+        The schema is checked and the validator class resolved once per
+        loader instead of on every validate_schema() call.
+        
+        Returns:
+            Validator for the loaded schema
+            
+        Raises:
+            SchemaValidationError: If the schema itself is invalid
+        """
+        if self._validator is None:
+            schema = self._load_schema()
+            validator_class = jsonschema.validators.validator_for(schema)
+            
+            try:
+                validator_class.check_schema(schema)
+            except jsonschema.SchemaError as e:
+                raise SchemaValidationError(f"Invalid schema: {e.message}") from e
+            
+            self._validator = validator_class(schema)
+        
+        return self._validator
     
     def load_from_file(self, file_path: str) -> List[BackupRecord]:
         """
@@ -208,8 +299,7 @@ class JSONDataLoader:
             raise JSONLoadError(f"File not found: {file_path}")
         
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _json_loads(path.read_bytes())
         except json.JSONDecodeError as e:
             raise JSONLoadError(f"Invalid JSON in file {file_path}: {e}") from e
         except Exception as e:
@@ -221,22 +311,7 @@ class JSONDataLoader:
         except SchemaValidationError as e:
             raise SchemaValidationError(f"Schema validation failed for {file_path}: {e}") from e
         
-        # Normalize records
-        normalized_records = []
-        errors = []
-        
-        for idx, raw_record in enumerate(data):
-            try:
-                normalized = self._normalize_record(raw_record)
-                normalized_records.append(normalized)
-            except Exception as e:
-                errors.append(f"Record {idx} (backup_id: {raw_record.get('backup_id', 'unknown')}): {e}")
-        
-        if errors:
-            error_msg = f"Failed to normalize {len(errors)} record(s):\n" + "\n".join(errors)
-            raise JSONLoadError(error_msg)
-        
-        return normalized_records
+        return self._normalize_records(data)
     
     def load_from_string(self, json_string: str) -> List[BackupRecord]:
         """
@@ -253,29 +328,33 @@ class JSONDataLoader:
             SchemaValidationError: If data doesn't match schema
         """
         try:
-            data = json.loads(json_string)
+            data = _json_loads(json_string)
         except json.JSONDecodeError as e:
             raise JSONLoadError(f"Invalid JSON string: {e}") from e
         
-        # Validate schema
         try:
-            self.validate_schema(data)
+            return self.load_from_dicts(data)
         except SchemaValidationError as e:
             raise SchemaValidationError(f"Schema validation failed: {e}") from e
+    
+    def load_from_dicts(self, data: List[Dict[str, Any]]) -> List[BackupRecord]:
+        """
+        Load backup records from already-parsed JSON data.
         
-        # Normalize records
-        normalized_records = []
-        errors = []
-        
-        for idx, raw_record in enumerate(data):
-            try:
-                normalized = self._normalize_record(raw_record)
-                normalized_records.append(normalized)
-            except Exception as e:
-                errors.append(f"Record {idx} (backup_id: {raw_record.get('backup_id', 'unknown')}): {e}")
+        Use this when the records are already Python objects (e.g. from another
+        API or a test) instead of serializing them to JSON and parsing again.
         
-        if errors:
-            error_msg = f"Failed to normalize {len(errors)} record(s):\n" + "\n".join(errors)
-            raise JSONLoadError(error_msg)
+        Args:
+            data: List of raw backup record dictionaries
+            
+        Returns:
+            List[BackupRecord]: List of normalized backup records
+            
+        Raises:
+            JSONLoadError: If records cannot be normalized
+            SchemaValidationError: If data doesn't match schema
+        """
+        # Validate schema
+        self.validate_schema(data)
         
-        return normalized_records
+        return self._normalize_records(data)
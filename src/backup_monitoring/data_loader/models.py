@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from enum import Enum
 
 
@@ -16,6 +16,13 @@ class BackupStatus(str, Enum):
 class BackupRecord(BaseModel):
     """Normalized backup record model."""
     
+    # Records are immutable once loaded; derive changed records with model_copy
+    model_config = ConfigDict(
+        frozen=True,
+        use_enum_values=True,
+        json_encoders={datetime: lambda v: v.isoformat()},
+    )
+    
     backup_id: str = Field(..., description="Unique identifier for the backup")
     start_time: datetime = Field(..., description="Backup start timestamp")
     end_time: datetime = Field(..., description="Backup end timestamp")
@@ -36,10 +43,3 @@ class BackupRecord(BaseModel):
         """Calculate backup duration in seconds."""
         delta = self.end_time - self.start_time
         return delta.total_seconds()
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
@@ -1,7 +1,13 @@
 """Historical comparison module for comparing metrics across periods."""
 
-from typing import List, Optional, Dict, Tuple
+import calendar
+from collections import ChainMap
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Mapping, Tuple
 from datetime import date, timedelta
+from itertools import groupby
+from operator import attrgetter
+from types import MappingProxyType
 from pydantic import BaseModel, Field
 
 from backup_monitoring.processing.models import (
@@ -18,14 +24,20 @@ class ComparisonError(Exception):
     pass
 
 
-class MetricDelta(BaseModel):
-    """Represents the change in a metric between two periods."""
+@dataclass(frozen=True)
+class MetricDelta:
+    """
+    Represents the change in a metric between two periods.
     
-    metric_name: str = Field(..., description="Name of the metric")
-    current_value: float = Field(..., description="Value in current period")
-    previous_value: float = Field(..., description="Value in previous period")
-    absolute_delta: float = Field(..., description="Absolute change (current - previous)")
-    percentage_delta: float = Field(..., description="Percentage change")
+    A plain frozen dataclass rather than a Pydantic model: a comparison
+    builds one per metric from values that are already validated floats.
+    """
+    
+    metric_name: str  # Name of the metric
+    current_value: float  # Value in current period
+    previous_value: float  # Value in previous period
+    absolute_delta: float  # Absolute change (current - previous)
+    percentage_delta: float  # Percentage change
     
     @property
     def is_increase(self) -> bool:
@@ -70,9 +82,14 @@ class PeriodComparison(BaseModel):
     has_previous_data: bool = Field(..., description="Whether previous period data exists")
     
     @property
-    def all_deltas(self) -> Dict[str, MetricDelta]:
-        """Get all deltas combined."""
-        return {**self.duration_deltas, **self.count_deltas, **self.rate_deltas}
+    def all_deltas(self) -> Mapping[str, MetricDelta]:
+        """
+        Get all deltas combined, as a read-only view over the delta groups.
+        
+        ChainMap iterates its last map first, so the groups are chained in
+        reverse to keep duration, count, rate order (their keys don't overlap).
+        """
+        return MappingProxyType(ChainMap(self.rate_deltas, self.count_deltas, self.duration_deltas))
 
 
 class HistoricalComparator:
@@ -93,6 +110,8 @@ class HistoricalComparator:
         Returns:
             PeriodComparison object
         """
+        has_previous = previous is not None
+        
         if previous is None:
             # Find previous day
             previous_date = current.date - timedelta(days=1)
@@ -112,7 +131,7 @@ class HistoricalComparator:
                 partial_count=0,
             )
         
-        return self._compare_metrics(current, previous, PeriodType.DAY)
+        return self._compare_metrics(current, previous, PeriodType.DAY, has_previous)
     
     def compare_weekly(
         self,
@@ -129,6 +148,8 @@ class HistoricalComparator:
         Returns:
             PeriodComparison object
         """
+        has_previous = previous is not None
+        
         if previous is None:
             # Find previous week
             previous_week_start = current.week_start - timedelta(weeks=1)
@@ -151,7 +172,7 @@ class HistoricalComparator:
                 partial_count=0,
             )
         
-        return self._compare_metrics(current, previous, PeriodType.WEEK)
+        return self._compare_metrics(current, previous, PeriodType.WEEK, has_previous)
     
     def compare_monthly(
         self,
@@ -168,17 +189,13 @@ class HistoricalComparator:
         Returns:
             PeriodComparison object
         """
+        has_previous = previous is not None
+        
         if previous is None:
             # Find previous month
-            if current.month == 1:
-                previous_year = current.year - 1
-                previous_month = 12
-            else:
-                previous_year = current.year
-                previous_month = current.month - 1
+            previous_year, previous_month = self._prev_year_month(current.year, current.month)
             
             previous_month_start = date(previous_year, previous_month, 1)
-            import calendar
             last_day = calendar.monthrange(previous_year, previous_month)[1]
             previous_month_end = date(previous_year, previous_month, last_day)
             
@@ -199,7 +216,7 @@ class HistoricalComparator:
                 partial_count=0,
             )
         
-        return self._compare_metrics(current, previous, PeriodType.MONTH)
+        return self._compare_metrics(current, previous, PeriodType.MONTH, has_previous)
     
     def compare_periods(
         self,
@@ -222,7 +239,8 @@ class HistoricalComparator:
         self,
         current: AggregatedMetrics,
         previous: Optional[AggregatedMetrics],
-        period_type: PeriodType
+        period_type: PeriodType,
+        has_previous: Optional[bool] = None
     ) -> PeriodComparison:
         """
         Internal method to compare metrics.
@@ -231,11 +249,14 @@ class HistoricalComparator:
             current: Current period metrics
             previous: Previous period metrics (None if no previous data)
             period_type: Type of period
+            has_previous: Whether previous holds real data; False when it is a
+                zero-valued placeholder. Defaults to whether previous is given.
             
         Returns:
             PeriodComparison object
         """
-        has_previous = previous is not None
+        if has_previous is None:
+            has_previous = previous is not None
         
         if previous is None:
             # Create zero metrics for comparison
@@ -254,67 +275,9 @@ class HistoricalComparator:
                 partial_count=0,
             )
         
-        # Calculate duration deltas
-        duration_deltas = {
-            "average_duration": self._calculate_delta(
-                "average_duration",
-                current.average_duration,
-                previous.average_duration
-            ),
-            "max_duration": self._calculate_delta(
-                "max_duration",
-                current.max_duration,
-                previous.max_duration
-            ),
-            "min_duration": self._calculate_delta(
-                "min_duration",
-                current.min_duration,
-                previous.min_duration
-            ),
-            "total_duration": self._calculate_delta(
-                "total_duration",
-                current.total_duration,
-                previous.total_duration
-            ),
-        }
-        
-        # Calculate count deltas
-        count_deltas = {
-            "total_count": self._calculate_delta(
-                "total_count",
-                float(current.total_count),
-                float(previous.total_count)
-            ),
-            "success_count": self._calculate_delta(
-                "success_count",
-                float(current.success_count),
-                float(previous.success_count)
-            ),
-            "failure_count": self._calculate_delta(
-                "failure_count",
-                float(current.failure_count),
-                float(previous.failure_count)
-            ),
-            "partial_count": self._calculate_delta(
-                "partial_count",
-                float(current.partial_count),
-                float(previous.partial_count)
-            ),
-        }
-        
-        # Calculate rate deltas
-        rate_deltas = {
-            "success_rate": self._calculate_delta(
-                "success_rate",
-                current.success_rate,
-                previous.success_rate
-            ),
-            "failure_rate": self._calculate_delta(
-                "failure_rate",
-                current.failure_rate,
-                previous.failure_rate
-            ),
-        }
+        duration_deltas = self._calculate_deltas(AggregatedMetrics.DURATION_METRICS, current, previous)
+        count_deltas = self._calculate_deltas(AggregatedMetrics.COUNT_METRICS, current, previous)
+        rate_deltas = self._calculate_deltas(AggregatedMetrics.RATE_METRICS, current, previous)
         
         return PeriodComparison(
             period_type=period_type,
@@ -331,6 +294,46 @@ class HistoricalComparator:
             has_previous_data=has_previous,
         )
     
+    @staticmethod
+    def _prev_year_month(year: int, month: int) -> Tuple[int, int]:
+        """
+        Get the year and month preceding the given month.
+        
+        Args:
+            year: Year
+            month: Month (1-12)
+            
+        Returns:
+            Tuple of (year, month) of the previous month
+        """
+        month_index = year * 12 + month - 2
+        return month_index // 12, month_index % 12 + 1
+    
+    def _calculate_deltas(
+        self,
+        metric_names: Tuple[str, ...],
+        current: AggregatedMetrics,
+        previous: AggregatedMetrics
+    ) -> Dict[str, MetricDelta]:
+        """
+        Calculate deltas for a group of metrics.
+        
+        Args:
+            metric_names: Names of the metric attributes to compare
+            current: Current period metrics
+            previous: Previous period metrics
+            
+        Returns:
+            Dictionary mapping metric name to MetricDelta
+        """
+        current_values = current.metric_values
+        previous_values = previous.metric_values
+        
+        return {
+            name: self._calculate_delta(name, current_values[name], previous_values[name])
+            for name in metric_names
+        }
+    
     def _calculate_delta(
         self,
         metric_name: str,
@@ -376,12 +379,18 @@ class HistoricalComparator:
         """
         Compare multiple consecutive periods.
         
+        Metrics are grouped by backup type and period type, and each period is
+        compared with the previous period of its group. Periods without an
+        earlier period in their group produce no comparison unless the list
+        holds a single period.
+        
         Args:
-            metrics_list: List of metrics ordered by period (oldest to newest)
+            metrics_list: List of metrics, possibly mixing backup types
             period_type: Optional period type (auto-detected if not provided)
             
         Returns:
-            List of PeriodComparison objects comparing each period to the previous one
+            List of PeriodComparison objects comparing each period to the previous one,
+            ordered by backup type, period type and period start
         """
         if not metrics_list:
             return []
@@ -391,21 +400,18 @@ class HistoricalComparator:
             period_type = period_type or metrics_list[0].period_type
             return [self._compare_metrics(metrics_list[0], None, period_type)]
         
-        comparisons = []
+        # Compare each period with the preceding one of the same backup type
+        # and period type, even when other series are interleaved in the list
+        series_key = attrgetter("backup_type", "period_type")
+        ordered = sorted(metrics_list, key=attrgetter("backup_type", "period_type", "period_start"))
         
-        for i in range(1, len(metrics_list)):
-            current = metrics_list[i]
-            previous = metrics_list[i - 1]
-            
-            # Ensure same backup type
-            if current.backup_type != previous.backup_type:
-                continue
-            
-            comparison = self._compare_metrics(
-                current,
-                previous,
-                period_type or current.period_type
+        comparisons: List[PeriodComparison] = []
+        
+        for _, group in groupby(ordered, key=series_key):
+            periods = list(group)
+            comparisons.extend(
+                self._compare_metrics(current, previous, period_type or current.period_type)
+                for previous, current in zip(periods, periods[1:])
             )
-            comparisons.append(comparison)
         
         return comparisons
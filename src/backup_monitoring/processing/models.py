@@ -1,8 +1,10 @@
 """Data models for processed metrics."""
 
+import datetime as dt
 from datetime import date, datetime
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from functools import cached_property
+from typing import Optional, Dict, Any, ClassVar, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -16,6 +18,22 @@ class PeriodType(str, Enum):
 class AggregatedMetrics(BaseModel):
     """Aggregated metrics for a specific period and backup type."""
     
+    # Immutable, so the cached properties below cannot go stale. Cached values
+    # live in __dict__; pydantic>=2.6 ignores them in __eq__ (GH-7444).
+    model_config = ConfigDict(frozen=True)
+    
+    # Metric names compared between periods, by group
+    DURATION_METRICS: ClassVar[Tuple[str, ...]] = (
+        "average_duration", "max_duration", "min_duration", "total_duration",
+    )
+    COUNT_METRICS: ClassVar[Tuple[str, ...]] = (
+        "total_count", "success_count", "failure_count", "partial_count",
+    )
+    RATE_METRICS: ClassVar[Tuple[str, ...]] = ("success_rate", "failure_rate")
+    
+    # Cached properties derived from field values; dropped by model_copy()
+    _CACHED_PROPERTIES: ClassVar[Tuple[str, ...]] = ("success_rate", "failure_rate", "metric_values")
+    
     period_start: date = Field(..., description="Start date of the aggregation period")
     period_end: date = Field(..., description="End date of the aggregation period")
     period_type: PeriodType = Field(..., description="Type of period (day/week/month)")
@@ -37,25 +55,60 @@ class AggregatedMetrics(BaseModel):
     anomaly_flag: bool = Field(False, description="Whether anomalies were detected")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    @property
+    @cached_property
     def success_rate(self) -> float:
         """Calculate success rate as a percentage."""
         if self.total_count == 0:
             return 0.0
         return (self.success_count / self.total_count) * 100.0
     
-    @property
+    @cached_property
     def failure_rate(self) -> float:
         """Calculate failure rate as a percentage."""
         if self.total_count == 0:
             return 0.0
         return (self.failure_count / self.total_count) * 100.0
+    
+    @cached_property
+    def metric_values(self) -> Dict[str, float]:
+        """
+        Float value of every compared metric, computed once per instance.
+        
+        A metrics object is usually compared twice in a series (as the
+        current and then as the previous period), so the values are cached.
+        """
+        names = self.DURATION_METRICS + self.COUNT_METRICS + self.RATE_METRICS
+        return {name: float(getattr(self, name)) for name in names}
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "AggregatedMetrics":
+        """
+        Copy the model without its cached derived values.
+        
+        The copy recomputes them on first access, so they always reflect
+        the copy's own field values (including any ``update``).
+        
+        Args:
+            update: Field values to change in the copy
+            deep: Whether to make a deep copy
+            
+        Returns:
+            Copy of the model
+        """
+        copy = super().model_copy(update=update, deep=deep)
+        
+        for name in self._CACHED_PROPERTIES:
+            copy.__dict__.pop(name, None)
+        
+        return copy
 
 
 class DailyMetrics(AggregatedMetrics):
     """Daily aggregated metrics."""
     period_type: PeriodType = Field(default=PeriodType.DAY, description="Period type is day")
-    date: date = Field(..., description="Date of the aggregation")
+    # Annotated via the module: a bare ``date`` here would resolve to this
+    # field's own FieldInfo, since the default is bound before the annotation
+    # is evaluated.
+    date: dt.date = Field(..., description="Date of the aggregation")
 
 
 class WeeklyMetrics(AggregatedMetrics):
@@ -1,8 +1,8 @@
 """Processing engine for computing aggregates and metrics."""
 
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Optional
-from collections import defaultdict
+from typing import Any, List, Dict, Optional, Type, TypeVar
+from collections import Counter, defaultdict
 import calendar
 
 from backup_monitoring.config.config_loader import get_config
@@ -15,6 +15,9 @@ from backup_monitoring.processing.models import (
     PeriodType,
 )
 
+# Metrics model built by _compute_metrics_for_records
+M = TypeVar("M", bound=AggregatedMetrics)
+
 
 class ProcessingError(Exception):
     """Exception raised when processing fails."""
@@ -70,16 +73,13 @@ class ProcessingEngine:
         daily_metrics = []
         
         for (record_date, backup_type), day_records in daily_data.items():
-            metrics = self._compute_metrics_for_records(
+            daily_metric = self._compute_metrics_for_records(
                 day_records,
                 record_date,
                 record_date,
                 PeriodType.DAY,
-                backup_type
-            )
-            
-            daily_metric = DailyMetrics(
-                **metrics.model_dump(),
+                backup_type,
+                metrics_cls=DailyMetrics,
                 date=record_date
             )
             daily_metrics.append(daily_metric)
@@ -124,19 +124,16 @@ class ProcessingEngine:
         for (week_start_date, backup_type), week_records in weekly_data.items():
             week_end_date = week_start_date + timedelta(days=6)
             
-            metrics = self._compute_metrics_for_records(
+            # Calculate week number
+            week_number = week_start_date.isocalendar()[1]
+            
+            weekly_metric = self._compute_metrics_for_records(
                 week_records,
                 week_start_date,
                 week_end_date,
                 PeriodType.WEEK,
-                backup_type
-            )
-            
-            # Calculate week number
-            week_number = week_start_date.isocalendar()[1]
-            
-            weekly_metric = WeeklyMetrics(
-                **metrics.model_dump(),
+                backup_type,
+                metrics_cls=WeeklyMetrics,
                 week_start=week_start_date,
                 week_end=week_end_date,
                 week_number=week_number
@@ -191,16 +188,13 @@ class ProcessingEngine:
             last_day = calendar.monthrange(record_year, record_month)[1]
             month_end = date(record_year, record_month, last_day)
             
-            metrics = self._compute_metrics_for_records(
+            monthly_metric = self._compute_metrics_for_records(
                 month_records,
                 month_start,
                 month_end,
                 PeriodType.MONTH,
-                backup_type
-            )
-            
-            monthly_metric = MonthlyMetrics(
-                **metrics.model_dump(),
+                backup_type,
+                metrics_cls=MonthlyMetrics,
                 year=record_year,
                 month=record_month
             )
@@ -214,8 +208,10 @@ class ProcessingEngine:
         period_start: date,
         period_end: date,
         period_type: PeriodType,
-        backup_type: str
-    ) -> AggregatedMetrics:
+        backup_type: str,
+        metrics_cls: Type[M],
+        **period_fields: Any
+    ) -> M:
         """
         Compute aggregated metrics for a list of records.
         
@@ -225,13 +221,15 @@ class ProcessingEngine:
             period_end: End date of the period
             period_type: Type of period
             backup_type: Type of backup
+            metrics_cls: Metrics model to build (e.g. DailyMetrics)
+            **period_fields: Extra fields required by metrics_cls
             
         Returns:
-            AggregatedMetrics object
+            metrics_cls instance
         """
         if not records:
             # Return zero metrics
-            return AggregatedMetrics(
+            return metrics_cls(
                 period_start=period_start,
                 period_end=period_end,
                 period_type=period_type,
@@ -244,6 +242,7 @@ class ProcessingEngine:
                 success_count=0,
                 failure_count=0,
                 partial_count=0,
+                **period_fields,
             )
         
         durations = [record.duration for record in records]
@@ -252,12 +251,10 @@ class ProcessingEngine:
         max_duration = max(durations) if durations else 0.0
         min_duration = min(durations) if durations else 0.0
         
-        # Count by status
-        success_count = sum(1 for r in records if r.status == BackupStatus.SUCCESS)
-        failure_count = sum(1 for r in records if r.status == BackupStatus.FAILURE)
-        partial_count = sum(1 for r in records if r.status == BackupStatus.PARTIAL)
+        # Count by status in a single pass (BackupStatus members hash like their values)
+        status_counts = Counter(record.status for record in records)
         
-        return AggregatedMetrics(
+        return metrics_cls(
             period_start=period_start,
             period_end=period_end,
             period_type=period_type,
@@ -267,9 +264,10 @@ class ProcessingEngine:
             min_duration=min_duration,
             total_duration=total_duration,
             total_count=len(records),
-            success_count=success_count,
-            failure_count=failure_count,
-            partial_count=partial_count,
+            success_count=status_counts[BackupStatus.SUCCESS],
+            failure_count=status_counts[BackupStatus.FAILURE],
+            partial_count=status_counts[BackupStatus.PARTIAL],
+            **period_fields,
         )
     
     def _get_week_start(self, target_date: date) -> date:
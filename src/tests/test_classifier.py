@@ -4,8 +4,7 @@ import pytest
 import tempfile
 import yaml
 from pathlib import Path
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
 
 from backup_monitoring.classifier.classifier import BackupClassifier, ClassificationError
 from backup_monitoring.classifier.rules import (
@@ -17,6 +16,11 @@ from backup_monitoring.classifier.rules import (
 )
 from backup_monitoring.data_loader.models import BackupRecord, BackupStatus
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 
 @pytest.fixture
 def sample_rules():
@@ -57,10 +61,10 @@ def sample_rules():
 @pytest.fixture
 def temp_rules_file(sample_rules):
     """Create a temporary rules YAML file."""
-    rules_data = {"rules": [rule.model_dump() for rule in sample_rules]}
+    rules_data = {"rules": [rule.model_dump(mode="json") for rule in sample_rules]}
     
     with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(rules_data, f)
+        yaml.dump(rules_data, f, Dumper=_YamlDumper)
         temp_path = f.name
     
     yield temp_path
@@ -74,14 +78,33 @@ def sample_backup_record():
     """Create a sample backup record."""
     return BackupRecord(
         backup_id="test-001",
-        start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=pytz.UTC),
-        end_time=datetime(2024, 1, 1, 10, 30, 0, tzinfo=pytz.UTC),
+        start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
+        end_time=datetime(2024, 1, 1, 10, 30, 0, tzinfo=timezone.utc),
         status=BackupStatus.SUCCESS,
         source_system="database-primary",
         metadata={"key": "value"}
     )
 
 
+def test_rule_evaluator_classifies_model_directly(sample_backup_record):
+    """Test that a BackupRecord is evaluated like its dumped dictionary."""
+    rules = [
+        ClassificationRule(
+            name="metadata",
+            conditions=[
+                Condition(field="metadata.key", operator=Operator.EQUALS, value="value"),
+                Condition(field="status", operator=Operator.EQUALS, value="success")
+            ],
+            backup_type="tagged"
+        ),
+    ]
+    
+    evaluator = RuleEvaluator(rules)
+    assert evaluator.classify(sample_backup_record) == "tagged"
+    assert evaluator.classify(sample_backup_record.model_dump()) == "tagged"
+    assert evaluator.classify(sample_backup_record.model_copy(update={"metadata": {}})) is None
+
+
 def test_classifier_loads_rules(temp_rules_file):
     """Test that classifier loads rules from file."""
     classifier = BackupClassifier()
@@ -109,8 +132,8 @@ def test_classifier_classifies_filesystem_backup(temp_rules_file):
     """Test classification of filesystem backup."""
     record = BackupRecord(
         backup_id="test-002",
-        start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=pytz.UTC),
-        end_time=datetime(2024, 1, 1, 10, 30, 0, tzinfo=pytz.UTC),
+        start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
+        end_time=datetime(2024, 1, 1, 10, 30, 0, tzinfo=timezone.utc),
         status=BackupStatus.SUCCESS,
         source_system="filesystem-storage"
     )
@@ -127,8 +150,8 @@ def test_classifier_uses_default_for_unknown(temp_rules_file):
     """Test that classifier uses default type for unknown backups."""
     record = BackupRecord(
         backup_id="test-003",
-        start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=pytz.UTC),
-        end_time=datetime(2024, 1, 1, 10, 30, 0, tzinfo=pytz.UTC),
+        start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
+        end_time=datetime(2024, 1, 1, 10, 30, 0, tzinfo=timezone.utc),
         status=BackupStatus.SUCCESS,
         source_system="unknown-system"
     )
@@ -145,8 +168,8 @@ def test_classifier_preserves_existing_type(sample_backup_record, temp_rules_fil
     """Test that classifier preserves existing backup_type."""
     record = BackupRecord(
         backup_id="test-004",
-        start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=pytz.UTC),
-        end_time=datetime(2024, 1, 1, 10, 30, 0, tzinfo=pytz.UTC),
+        start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
+        end_time=datetime(2024, 1, 1, 10, 30, 0, tzinfo=timezone.utc),
         status=BackupStatus.SUCCESS,
         source_system="database-primary",
         backup_type="custom_type"  # Already set
@@ -165,8 +188,8 @@ def test_classifier_batch_classification(temp_rules_file):
     records = [
         BackupRecord(
             backup_id=f"test-{i}",
-            start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=pytz.UTC),
-            end_time=datetime(2024, 1, 1, 10, 30, 0, tzinfo=pytz.UTC),
+            start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
+            end_time=datetime(2024, 1, 1, 10, 30, 0, tzinfo=timezone.utc),
             status=BackupStatus.SUCCESS,
             source_system=["database-primary", "filesystem-storage", "unknown"][i]
         )
@@ -220,6 +243,24 @@ def test_rule_evaluator_contains_operator():
     assert evaluator.classify(record2) == "database"
 
 
+def test_rule_evaluator_not_contains_operator():
+    """Test rule evaluator with not_contains operator."""
+    rule = ClassificationRule(
+        name="test",
+        conditions=[
+            Condition(field="source_system", operator=Operator.NOT_CONTAINS, value="TEST", case_sensitive=False)
+        ],
+        backup_type="production"
+    )
+    
+    evaluator = RuleEvaluator([rule])
+    record = {"source_system": "prod-server"}
+    assert evaluator.classify(record) == "production"
+    
+    record2 = {"source_system": "test-server"}  # Case insensitive
+    assert evaluator.classify(record2) is None
+
+
 def test_rule_evaluator_starts_with_operator():
     """Test rule evaluator with starts_with operator."""
     rule = ClassificationRule(
@@ -238,6 +279,68 @@ def test_rule_evaluator_starts_with_operator():
     assert evaluator.classify(record2) is None
 
 
+def test_rule_evaluator_multiple_regex_rules_same_field():
+    """Test that several regex rules on one field keep first-match order."""
+    rules = [
+        ClassificationRule(
+            name="vm",
+            conditions=[
+                Condition(field="source_system", operator=Operator.REGEX, value=r"^vm-\d+"),
+                Condition(field="status", operator=Operator.EQUALS, value="success")
+            ],
+            backup_type="virtual_machine"
+        ),
+        ClassificationRule(
+            name="db",
+            conditions=[Condition(field="source_system", operator=Operator.REGEX, value=r"db|sql", case_sensitive=False)],
+            backup_type="database"
+        ),
+        ClassificationRule(
+            name="tagged",
+            conditions=[Condition(field="source_system", operator=Operator.REGEX, value=r"(a|b)-\1")],
+            backup_type="tagged"
+        ),
+    ]
+    
+    evaluator = RuleEvaluator(rules)
+    assert evaluator.classify({"source_system": "vm-01", "status": "success"}) == "virtual_machine"
+    assert evaluator.classify({"source_system": "vm-01", "status": "failed"}) is None
+    assert evaluator.classify({"source_system": "MySQL-01"}) == "database"
+    assert evaluator.classify({"source_system": "b-b"}) == "tagged"
+    assert evaluator.classify({"source_system": "fileserver"}) is None
+    assert evaluator.classify({}) is None
+
+
+def test_rule_evaluator_regex_global_inline_flags_not_combined():
+    """Test that a pattern with a global inline flag does not change other regex rules."""
+    rules = [
+        ClassificationRule(
+            name="vm",
+            conditions=[Condition(field="source_system", operator=Operator.REGEX, value=r"(?x) ^vm - \d+")],
+            backup_type="virtual_machine"
+        ),
+        ClassificationRule(
+            name="db",
+            conditions=[Condition(field="source_system", operator=Operator.REGEX, value=r"^db server")],
+            backup_type="database"
+        ),
+        ClassificationRule(
+            name="fs",
+            conditions=[Condition(field="source_system", operator=Operator.REGEX, value=r"^file server")],
+            backup_type="filesystem"
+        ),
+    ]
+    
+    evaluator = RuleEvaluator(rules)
+    _, _, regex_unions = evaluator._prepared
+    assert "(?x)" not in regex_unions[("source_system",)].pattern
+    
+    assert evaluator.classify({"source_system": "vm-01"}) == "virtual_machine"
+    assert evaluator.classify({"source_system": "db server"}) == "database"
+    assert evaluator.classify({"source_system": "file server"}) == "filesystem"
+    assert evaluator.classify({"source_system": "dbserver"}) is None
+
+
 def test_rule_evaluator_in_operator():
     """Test rule evaluator with in operator."""
     rule = ClassificationRule(
@@ -344,6 +447,34 @@ def test_rule_evaluator_missing_field():
     assert evaluator.classify(record) is None
 
 
+def test_rule_evaluator_rule_order_with_default():
+    """Test that rules keep first-match order and a catch-all rule ends evaluation."""
+    rules = [
+        ClassificationRule(
+            name="nested",
+            conditions=[Condition(field="metadata.type", operator=Operator.EQUALS, value="full")],
+            backup_type="full_backup"
+        ),
+        ClassificationRule(
+            name="database",
+            conditions=[Condition(field="source_system", operator=Operator.CONTAINS, value="database")],
+            backup_type="database"
+        ),
+        ClassificationRule(name="default", conditions=[], backup_type="unknown"),
+        ClassificationRule(
+            name="unreachable",
+            conditions=[Condition(field="source_system", operator=Operator.CONTAINS, value="vm")],
+            backup_type="virtual_machine"
+        ),
+    ]
+    
+    evaluator = RuleEvaluator(rules)
+    assert evaluator.classify({"source_system": "database-01", "metadata": {"type": "full"}}) == "full_backup"
+    assert evaluator.classify({"source_system": "database-01"}) == "database"
+    assert evaluator.classify({"source_system": "vm-01"}) == "unknown"
+    assert evaluator.classify({}) == "unknown"
+
+
 def test_classifier_reload_rules(temp_rules_file):
     """Test that classifier can reload rules."""
     classifier = BackupClassifier()
@@ -360,6 +491,62 @@ def test_classifier_reload_rules(temp_rules_file):
     assert classifier._evaluator is None  # Should be reset
 
 
+def test_classifiers_do_not_share_rules(temp_rules_file):
+    """Test that classifiers loading the same file get independent rule objects."""
+    first = BackupClassifier()
+    first.rules_path = Path(temp_rules_file)
+    second = BackupClassifier()
+    second.rules_path = Path(temp_rules_file)
+    
+    first_rules = first._load_rules()
+    first_rules[0].backup_type = "changed"
+    first_rules[0].conditions[0].value = "changed"
+    
+    second_rules = second._load_rules()
+    
+    assert second_rules[0] is not first_rules[0]
+    assert second_rules[0].backup_type == "database"
+    assert second_rules[0].conditions[0].value == "database"
+
+
+def test_classifier_reuses_evaluator(temp_rules_file, sample_backup_record):
+    """Test that rules are prepared once and reused across classify calls."""
+    classifier = BackupClassifier()
+    classifier.rules_path = Path(temp_rules_file)
+    
+    evaluator = classifier._get_evaluator()
+    classifier.classify(sample_backup_record)
+    prepared = evaluator._prepared
+    classifier.classify_batch([sample_backup_record, sample_backup_record])
+    
+    assert classifier._get_evaluator() is evaluator
+    assert evaluator._prepared is prepared
+
+
+def test_classifier_picks_up_edited_rules_file(tmp_path):
+    """Test that cached rules are re-read when the rules file changes."""
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(yaml.safe_dump({"rules": [
+        {"name": "default", "conditions": [], "backup_type": "unknown"},
+    ]}))
+    
+    classifier = BackupClassifier()
+    classifier.rules_path = rules_file
+    assert len(classifier._load_rules()) == 1
+    
+    rules_file.write_text(yaml.safe_dump({"rules": [
+        {"name": "vm", "conditions": [{"field": "source_system", "operator": "contains", "value": "vm"}],
+         "backup_type": "virtual_machine"},
+        {"name": "default", "conditions": [], "backup_type": "unknown"},
+    ]}))
+    
+    classifier = BackupClassifier()
+    classifier.rules_path = rules_file
+    rules = classifier._load_rules()
+    assert len(rules) == 2
+    assert rules[0].backup_type == "virtual_machine"
+
+
 def test_classifier_missing_rules_file():
     """Test error handling for missing rules file."""
     classifier = BackupClassifier()
@@ -1,8 +1,10 @@
 """Tests for historical comparison module."""
 
+import copy
+import pickle
+
 import pytest
 from datetime import date, datetime, timedelta
-import pytz
 
 from backup_monitoring.processing.comparison import (
     HistoricalComparator,
@@ -20,23 +22,44 @@ from backup_monitoring.processing.models import (
 from backup_monitoring.data_loader.models import BackupStatus
 
 
-@pytest.fixture
+# Zero-valued daily metrics; tests derive the values they need with _daily()
+_DAILY_TEMPLATE = DailyMetrics(
+    period_start=date(2024, 1, 1),
+    period_end=date(2024, 1, 1),
+    period_type=PeriodType.DAY,
+    backup_type="database",
+    date=date(2024, 1, 1),
+    average_duration=0.0,
+    max_duration=0.0,
+    min_duration=0.0,
+    total_duration=0.0,
+    total_count=0,
+    success_count=0,
+    failure_count=0,
+    partial_count=0,
+)
+
+
+def _daily(day: date, **overrides) -> DailyMetrics:
+    """Copy the daily template for the given day, skipping revalidation."""
+    return _DAILY_TEMPLATE.model_copy(
+        update={"period_start": day, "period_end": day, "date": day, **overrides}
+    )
+
+
+@pytest.fixture(scope="module")
 def comparator():
-    """Create a HistoricalComparator instance."""
+    """Create a HistoricalComparator instance (shared; it is stateless)."""
     return HistoricalComparator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_daily_metrics():
     """Create sample daily metrics for testing."""
     base_date = date(2024, 1, 2)
     
-    current = DailyMetrics(
-        period_start=base_date,
-        period_end=base_date,
-        period_type=PeriodType.DAY,
-        backup_type="database",
-        date=base_date,
+    current = _daily(
+        base_date,
         average_duration=1800.0,  # 30 minutes
         max_duration=3600.0,  # 1 hour
         min_duration=900.0,  # 15 minutes
@@ -44,23 +67,16 @@ def sample_daily_metrics():
         total_count=4,
         success_count=3,
         failure_count=1,
-        partial_count=0,
     )
     
-    previous = DailyMetrics(
-        period_start=base_date - timedelta(days=1),
-        period_end=base_date - timedelta(days=1),
-        period_type=PeriodType.DAY,
-        backup_type="database",
-        date=base_date - timedelta(days=1),
+    previous = _daily(
+        base_date - timedelta(days=1),
         average_duration=1500.0,  # 25 minutes
         max_duration=3000.0,  # 50 minutes
         min_duration=600.0,  # 10 minutes
         total_duration=4500.0,  # 1.25 hours total
         total_count=3,
         success_count=3,
-        failure_count=0,
-        partial_count=0,
     )
     
     return current, previous
@@ -233,6 +249,60 @@ def test_compare_monthly_year_boundary(comparator):
     assert comparison.previous_period_start.month == 12
 
 
+def test_compare_without_previous_does_not_report_placeholder(comparator):
+    """Test that the zero-valued placeholder period is not reported as previous data."""
+    counts = dict(
+        average_duration=1800.0,
+        max_duration=3600.0,
+        min_duration=900.0,
+        total_duration=18000.0,
+        total_count=10,
+        success_count=10,
+        failure_count=0,
+        partial_count=0,
+    )
+    weekly = WeeklyMetrics(
+        period_start=date(2024, 1, 8),
+        period_end=date(2024, 1, 14),
+        backup_type="database",
+        week_start=date(2024, 1, 8),
+        week_end=date(2024, 1, 14),
+        week_number=2,
+        **counts,
+    )
+    monthly = MonthlyMetrics(
+        period_start=date(2024, 3, 1),
+        period_end=date(2024, 3, 31),
+        backup_type="database",
+        year=2024,
+        month=3,
+        **counts,
+    )
+    
+    weekly_comparison = comparator.compare_weekly(weekly, None)
+    monthly_comparison = comparator.compare_monthly(monthly, None)
+    
+    for comparison in (weekly_comparison, monthly_comparison):
+        assert comparison.has_previous_data is False
+        assert comparison.previous_metrics is None
+        assert comparison.count_deltas["total_count"].previous_value == 0.0
+    
+    # The placeholder still supplies the previous period's dates
+    assert weekly_comparison.previous_period_start == date(2024, 1, 1)
+    assert monthly_comparison.previous_period_start == date(2024, 2, 1)
+    assert monthly_comparison.previous_period_end == date(2024, 2, 29)
+
+
+@pytest.mark.parametrize("year, month, expected", [
+    (2024, 1, (2023, 12)),
+    (2024, 2, (2024, 1)),
+    (2024, 12, (2024, 11)),
+])
+def test_prev_year_month(year, month, expected):
+    """Test previous month calculation, including the year boundary."""
+    assert HistoricalComparator._prev_year_month(year, month) == expected
+
+
 def test_metric_delta_properties():
     """Test MetricDelta properties."""
     # Increase
@@ -274,37 +344,16 @@ def test_metric_delta_properties():
 
 def test_percentage_delta_zero_previous(comparator):
     """Test percentage delta calculation when previous value is zero."""
-    current = DailyMetrics(
-        period_start=date(2024, 1, 2),
-        period_end=date(2024, 1, 2),
-        period_type=PeriodType.DAY,
-        backup_type="database",
-        date=date(2024, 1, 2),
+    current = _daily(
+        date(2024, 1, 2),
         average_duration=1800.0,
         max_duration=3600.0,
         min_duration=900.0,
         total_duration=1800.0,
         total_count=1,
         success_count=1,
-        failure_count=0,
-        partial_count=0,
-    )
-    
-    previous = DailyMetrics(
-        period_start=date(2024, 1, 1),
-        period_end=date(2024, 1, 1),
-        period_type=PeriodType.DAY,
-        backup_type="database",
-        date=date(2024, 1, 1),
-        average_duration=0.0,
-        max_duration=0.0,
-        min_duration=0.0,
-        total_duration=0.0,
-        total_count=0,
-        success_count=0,
-        failure_count=0,
-        partial_count=0,
     )
+    previous = _daily(date(2024, 1, 1))
     
     comparison = comparator.compare_daily(current, previous)
     
@@ -315,37 +364,8 @@ def test_percentage_delta_zero_previous(comparator):
 
 def test_percentage_delta_both_zero(comparator):
     """Test percentage delta when both values are zero."""
-    current = DailyMetrics(
-        period_start=date(2024, 1, 2),
-        period_end=date(2024, 1, 2),
-        period_type=PeriodType.DAY,
-        backup_type="database",
-        date=date(2024, 1, 2),
-        average_duration=0.0,
-        max_duration=0.0,
-        min_duration=0.0,
-        total_duration=0.0,
-        total_count=0,
-        success_count=0,
-        failure_count=0,
-        partial_count=0,
-    )
-    
-    previous = DailyMetrics(
-        period_start=date(2024, 1, 1),
-        period_end=date(2024, 1, 1),
-        period_type=PeriodType.DAY,
-        backup_type="database",
-        date=date(2024, 1, 1),
-        average_duration=0.0,
-        max_duration=0.0,
-        min_duration=0.0,
-        total_duration=0.0,
-        total_count=0,
-        success_count=0,
-        failure_count=0,
-        partial_count=0,
-    )
+    current = _daily(date(2024, 1, 2))
+    previous = _daily(date(2024, 1, 1))
     
     comparison = comparator.compare_daily(current, previous)
     
@@ -359,20 +379,14 @@ def test_compare_multiple_periods(comparator):
     dates = [date(2024, 1, i) for i in range(1, 4)]
     
     metrics_list = [
-        DailyMetrics(
-            period_start=d,
-            period_end=d,
-            period_type=PeriodType.DAY,
-            backup_type="database",
-            date=d,
+        _daily(
+            d,
             average_duration=1000.0 * (i + 1),  # Increasing
             max_duration=2000.0 * (i + 1),
             min_duration=500.0 * (i + 1),
             total_duration=1000.0 * (i + 1),
             total_count=i + 1,
             success_count=i + 1,
-            failure_count=0,
-            partial_count=0,
         )
         for i, d in enumerate(dates)
     ]
@@ -394,20 +408,14 @@ def test_compare_multiple_periods(comparator):
 def test_compare_multiple_periods_single(comparator):
     """Test comparing multiple periods with only one period."""
     metrics_list = [
-        DailyMetrics(
-            period_start=date(2024, 1, 1),
-            period_end=date(2024, 1, 1),
-            period_type=PeriodType.DAY,
-            backup_type="database",
-            date=date(2024, 1, 1),
+        _daily(
+            date(2024, 1, 1),
             average_duration=1800.0,
             max_duration=3600.0,
             min_duration=900.0,
             total_duration=1800.0,
             total_count=1,
             success_count=1,
-            failure_count=0,
-            partial_count=0,
         )
     ]
     
@@ -426,35 +434,24 @@ def test_compare_multiple_periods_empty(comparator):
 def test_compare_multiple_periods_different_backup_types(comparator):
     """Test that different backup types are not compared."""
     metrics_list = [
-        DailyMetrics(
-            period_start=date(2024, 1, 1),
-            period_end=date(2024, 1, 1),
-            period_type=PeriodType.DAY,
-            backup_type="database",
-            date=date(2024, 1, 1),
+        _daily(
+            date(2024, 1, 1),
             average_duration=1800.0,
             max_duration=3600.0,
             min_duration=900.0,
             total_duration=1800.0,
             total_count=1,
             success_count=1,
-            failure_count=0,
-            partial_count=0,
         ),
-        DailyMetrics(
-            period_start=date(2024, 1, 2),
-            period_end=date(2024, 1, 2),
-            period_type=PeriodType.DAY,
+        _daily(
+            date(2024, 1, 2),
             backup_type="filesystem",  # Different backup type
-            date=date(2024, 1, 2),
             average_duration=1800.0,
             max_duration=3600.0,
             min_duration=900.0,
             total_duration=1800.0,
             total_count=1,
             success_count=1,
-            failure_count=0,
-            partial_count=0,
         ),
     ]
     
@@ -464,6 +461,31 @@ def test_compare_multiple_periods_different_backup_types(comparator):
     assert len(comparisons) == 0
 
 
+def test_compare_multiple_periods_interleaved_backup_types(comparator):
+    """Test that interleaved backup types are compared within their own series."""
+    metrics_list = [
+        _daily(
+            date(2024, 1, day),
+            backup_type=backup_type,
+            average_duration=1800.0,
+            max_duration=3600.0,
+            min_duration=900.0,
+            total_duration=1800.0,
+            total_count=1,
+            success_count=1,
+        )
+        for day in (1, 2)
+        for backup_type in ("database", "filesystem")
+    ]
+    
+    comparisons = comparator.compare_multiple_periods(metrics_list)
+    
+    assert [c.backup_type for c in comparisons] == ["database", "filesystem"]
+    for comparison in comparisons:
+        assert comparison.current_period_start == date(2024, 1, 2)
+        assert comparison.previous_period_start == date(2024, 1, 1)
+
+
 def test_rate_deltas(comparator, sample_daily_metrics):
     """Test that rate deltas are calculated correctly."""
     current, previous = sample_daily_metrics
@@ -480,6 +502,32 @@ def test_rate_deltas(comparator, sample_daily_metrics):
     assert success_rate_delta.absolute_delta == -25.0  # Decreased
 
 
+def test_comparison_serializes_deltas(comparator, sample_daily_metrics):
+    """Test that deltas are included when a comparison is dumped."""
+    current, previous = sample_daily_metrics
+    
+    dumped = comparator.compare_daily(current, previous).model_dump()
+    
+    assert dumped["rate_deltas"]["success_rate"] == {
+        "metric_name": "success_rate",
+        "current_value": 75.0,
+        "previous_value": 100.0,
+        "absolute_delta": -25.0,
+        "percentage_delta": -25.0,
+    }
+
+
+def test_comparison_copy_and_pickle_round_trip(comparator, sample_daily_metrics):
+    """Test that comparisons survive deepcopy and pickling."""
+    current, previous = sample_daily_metrics
+    
+    comparison = comparator.compare_daily(current, previous)
+    
+    assert comparison.model_copy(deep=True) == comparison
+    assert copy.deepcopy(comparison) == comparison
+    assert pickle.loads(pickle.dumps(comparison)) == comparison
+
+
 def test_all_deltas_property(comparator, sample_daily_metrics):
     """Test that all_deltas property combines all delta types."""
     current, previous = sample_daily_metrics
@@ -496,3 +544,13 @@ def test_all_deltas_property(comparator, sample_daily_metrics):
     assert len(all_deltas) == len(comparison.duration_deltas) + \
            len(comparison.count_deltas) + \
            len(comparison.rate_deltas)
+    
+    # Duration, then count, then rate deltas, each in their own order
+    assert list(all_deltas) == [
+        *comparison.duration_deltas,
+        *comparison.count_deltas,
+        *comparison.rate_deltas,
+    ]
+    
+    with pytest.raises(TypeError):
+        all_deltas["average_duration"] = comparison.rate_deltas["success_rate"]
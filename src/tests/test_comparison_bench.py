@@ -0,0 +1,44 @@
+"""Benchmarks for historical comparison module."""
+
+import pytest
+from datetime import date, timedelta
+
+from backup_monitoring.processing.comparison import HistoricalComparator
+from backup_monitoring.processing.models import DailyMetrics, PeriodType
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture
+def daily_metrics_series():
+    """A year of daily metrics for two interleaved backup types."""
+    start = date(2024, 1, 1)
+    return [
+        DailyMetrics(
+            period_start=start + timedelta(days=i),
+            period_end=start + timedelta(days=i),
+            period_type=PeriodType.DAY,
+            backup_type=backup_type,
+            date=start + timedelta(days=i),
+            average_duration=1800.0 + i,
+            max_duration=3600.0 + i,
+            min_duration=900.0,
+            total_duration=1800.0 * (i % 5 + 1),
+            total_count=i % 5 + 1,
+            success_count=i % 5 + 1,
+            failure_count=0,
+            partial_count=0,
+        )
+        for i in range(500)
+        for backup_type in ("database", "filesystem")
+    ]
+
+
+@pytest.mark.benchmark(group="comparison")
+def test_bench_compare_multiple_periods(benchmark, daily_metrics_series):
+    """Benchmark comparing a long series of consecutive daily periods."""
+    comparator = HistoricalComparator()
+    
+    comparisons = benchmark(comparator.compare_multiple_periods, daily_metrics_series)
+    
+    assert len(comparisons) == len(daily_metrics_series) - 2
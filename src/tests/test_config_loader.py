@@ -1,14 +1,20 @@
 """Tests for configuration loader."""
 
+import io
 import pytest
 import tempfile
 import yaml
 from pathlib import Path
-from backup_monitoring.config.config_loader import ConfigLoader, SystemConfig, get_config
+from backup_monitoring.config.config_loader import (
+    ConfigLoader,
+    SystemConfig,
+    get_config,
+    _load_config_cached,
+)
 
 
 def test_config_loader_loads_valid_config():
-    """Test that ConfigLoader loads a valid configuration file."""
+    """Test that ConfigLoader loads a valid configuration."""
     # Create a temporary config file
     config_data = {
         "app": {
@@ -49,23 +55,17 @@ def test_config_loader_loads_valid_config():
         }
     }
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(config_data, f)
-        config_path = f.name
+    loader = ConfigLoader("/nonexistent/config.yaml")
+    config = loader.load_from_stream(io.StringIO(yaml.dump(config_data)))
     
-    try:
-        loader = ConfigLoader(config_path)
-        config = loader.load()
-        
-        assert isinstance(config, SystemConfig)
-        assert config.app.name == "Test App"
-        assert config.app.version == "1.0.0"
-        assert config.app.log_level == "DEBUG"
-        assert config.data_loader.json_schema_path == "schema.json"
-        assert config.processing.aggregation_periods == ["day", "week"]
-        assert config.anomaly_detection.enabled is True
-    finally:
-        Path(config_path).unlink()
+    assert isinstance(config, SystemConfig)
+    assert loader.get_config() is config
+    assert config.app.name == "Test App"
+    assert config.app.version == "1.0.0"
+    assert config.app.log_level == "DEBUG"
+    assert config.data_loader.json_schema_path == "schema.json"
+    assert config.processing.aggregation_periods == ["day", "week"]
+    assert config.anomaly_detection.enabled is True
 
 
 def test_config_loader_raises_on_missing_file():
@@ -78,17 +78,12 @@ def test_config_loader_raises_on_missing_file():
 
 def test_config_loader_raises_on_invalid_config():
     """Test that ConfigLoader raises ValueError for invalid config."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        # Invalid config - missing required fields
-        yaml.dump({"app": {"name": "Test"}}, f)
-        config_path = f.name
+    # Invalid config - missing required fields
+    stream = io.StringIO(yaml.dump({"app": {"name": "Test"}}))
     
-    try:
-        loader = ConfigLoader(config_path)
-        with pytest.raises(Exception):  # Pydantic validation error
-            loader.load()
-    finally:
-        Path(config_path).unlink()
+    loader = ConfigLoader("/nonexistent/config.yaml")
+    with pytest.raises(Exception):  # Pydantic validation error
+        loader.load_from_stream(stream)
 
 
 def test_get_config_function():
@@ -127,3 +122,42 @@ def test_config_reload():
         assert config1.app.name == config2.app.name
     finally:
         Path(config_path).unlink()
+
+
+def test_config_loader_picks_up_edited_file(tmp_path):
+    """Test that the cached configuration is re-read when the file changes."""
+    config_data = {
+        "app": {"name": "Test", "version": "1.0.0"},
+        "data_loader": {},
+        "classifier": {},
+        "processing": {},
+        "anomaly_detection": {},
+        "reporting": {},
+        "integration": {}
+    }
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.dump(config_data))
+    
+    loader = ConfigLoader(str(config_path))
+    hits = _load_config_cached.cache_info().hits
+    assert loader.load() == ConfigLoader(str(config_path)).load()
+    assert _load_config_cached.cache_info().hits == hits + 1
+    
+    config_data["app"]["name"] = "Edited Test App"
+    config_path.write_text(yaml.dump(config_data))
+    
+    assert loader.load().app.name == "Edited Test App"
+
+
+def test_config_loaders_do_not_share_mutations(config_dir):
+    """Test that loaders of the same file get independent config objects."""
+    config_path = config_dir / "config.yaml"
+    
+    first = ConfigLoader(str(config_path)).load()
+    first.data_loader.default_timezone = "Europe/Paris"
+    first.processing.aggregation_periods.append("year")
+    
+    second = ConfigLoader(str(config_path)).load()
+    
+    assert second.data_loader.default_timezone != "Europe/Paris"
+    assert "year" not in second.processing.aggregation_periods
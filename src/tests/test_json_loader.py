@@ -2,10 +2,9 @@
 
 import pytest
 import json
-import tempfile
-from pathlib import Path
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from pydantic import ValidationError
 
 from backup_monitoring.data_loader.json_loader import (
     JSONDataLoader,
@@ -16,9 +15,9 @@ from backup_monitoring.data_loader.json_loader import (
 from backup_monitoring.data_loader.models import BackupRecord, BackupStatus
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_backup_data():
-    """Sample valid backup data."""
+    """Sample valid backup data (shared by the module; do not mutate)."""
     return [
         {
             "backup_id": "backup-001",
@@ -40,21 +39,16 @@ def sample_backup_data():
 
 
 @pytest.fixture
-def temp_json_file(sample_backup_data):
+def temp_json_file(tmp_path, sample_backup_data):
     """Create a temporary JSON file with sample data."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(sample_backup_data, f)
-        temp_path = f.name
-    
-    yield temp_path
-    
-    # Cleanup
-    Path(temp_path).unlink()
+    json_path = tmp_path / "backups.json"
+    json_path.write_text(json.dumps(sample_backup_data), encoding="utf-8")
+    return str(json_path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def loader():
-    """Create a JSONDataLoader instance."""
+    """Create a JSONDataLoader instance shared by the module's tests."""
     return JSONDataLoader()
 
 
@@ -80,46 +74,49 @@ def test_load_from_string(loader, sample_backup_data):
     assert isinstance(records[0], BackupRecord)
 
 
-def test_timestamp_normalization_iso_format(loader):
-    """Test timestamp normalization with ISO format."""
+@pytest.mark.parametrize("start, end", [
+    ("2024-01-01T10:00:00Z", "2024-01-01T10:30:00Z"),  # ISO with UTC designator
+    ("2024-01-01T10:00:00", "2024-01-01T10:30:00"),  # ISO without timezone (assumes UTC)
+    ("2024-01-01 10:00:00", "2024-01-01 10:30:00"),  # Space-separated format
+])
+def test_timestamp_normalization(loader, start, end):
+    """Test timestamp normalization of supported formats to timezone-aware UTC."""
     data = [{
         "backup_id": "test-001",
-        "start_time": "2024-01-01T10:00:00Z",
-        "end_time": "2024-01-01T10:30:00Z",
+        "start_time": start,
+        "end_time": end,
         "status": "success"
     }]
     
-    records = loader.load_from_string(json.dumps(data))
-    assert records[0].start_time.tzinfo is not None
-    assert records[0].end_time.tzinfo is not None
+    records = loader.load_from_dicts(data)
+    assert records[0].start_time == datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+    assert records[0].end_time == datetime(2024, 1, 1, 10, 30, 0, tzinfo=timezone.utc)
+    assert records[0].start_time.tzinfo == timezone.utc
 
 
-def test_timestamp_normalization_without_timezone(loader):
-    """Test timestamp normalization without timezone (assumes UTC)."""
-    data = [{
-        "backup_id": "test-001",
-        "start_time": "2024-01-01T10:00:00",
-        "end_time": "2024-01-01T10:30:00",
-        "status": "success"
-    }]
+def test_timestamp_normalization_custom_date_format():
+    """Test that non-ISO strings are parsed with the configured date format."""
+    loader = JSONDataLoader()
+    loader.date_format = "%d/%m/%Y %H:%M:%S"
     
-    records = loader.load_from_string(json.dumps(data))
-    assert records[0].start_time.tzinfo is not None
-    assert records[0].start_time.tzinfo == pytz.UTC
+    dt = loader._normalize_timestamp("01/02/2024 10:00:00")
+    
+    assert dt == datetime(2024, 2, 1, 10, 0, 0, tzinfo=timezone.utc)
 
 
-def test_timestamp_normalization_custom_format(loader):
-    """Test timestamp normalization with custom format."""
-    data = [{
-        "backup_id": "test-001",
-        "start_time": "2024-01-01 10:00:00",
-        "end_time": "2024-01-01 10:30:00",
-        "status": "success"
-    }]
+def test_timestamp_normalization_default_timezone():
+    """Test that naive timestamps take the configured zone's offset for that date."""
+    loader = JSONDataLoader()
+    try:
+        loader.default_timezone = ZoneInfo("America/New_York")
+    except ZoneInfoNotFoundError:
+        pytest.skip("tz database not available")
+    
+    winter = loader._normalize_timestamp("2024-01-01T10:00:00")
+    summer = loader._normalize_timestamp("2024-07-01T10:00:00")
     
-    records = loader.load_from_string(json.dumps(data))
-    assert records[0].start_time.year == 2024
-    assert records[0].start_time.hour == 10
+    assert winter.utcoffset().total_seconds() == -5 * 3600
+    assert summer.utcoffset().total_seconds() == -4 * 3600
 
 
 def test_invalid_timestamp(loader):
@@ -132,7 +129,7 @@ def test_invalid_timestamp(loader):
     }]
     
     with pytest.raises(TimestampNormalizationError):
-        loader.load_from_string(json.dumps(data))
+        loader.load_from_dicts(data)
 
 
 def test_schema_validation_missing_required_field(loader):
@@ -143,7 +140,7 @@ def test_schema_validation_missing_required_field(loader):
     }]
     
     with pytest.raises(SchemaValidationError):
-        loader.load_from_string(json.dumps(invalid_data))
+        loader.load_from_dicts(invalid_data)
 
 
 def test_schema_validation_invalid_status(loader):
@@ -157,7 +154,7 @@ def test_schema_validation_invalid_status(loader):
     
     # Schema validation should pass, but normalization should fail
     with pytest.raises(JSONLoadError):
-        loader.load_from_string(json.dumps(invalid_data))
+        loader.load_from_dicts(invalid_data)
 
 
 def test_end_time_before_start_time(loader):
@@ -170,7 +167,7 @@ def test_end_time_before_start_time(loader):
     }]
     
     with pytest.raises(JSONLoadError):
-        loader.load_from_string(json.dumps(invalid_data))
+        loader.load_from_dicts(invalid_data)
 
 
 def test_missing_file(loader):
@@ -181,17 +178,13 @@ def test_missing_file(loader):
     assert "not found" in str(exc_info.value).lower()
 
 
-def test_invalid_json_file(loader):
+def test_invalid_json_file(loader, tmp_path):
     """Test error handling for invalid JSON."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        f.write("invalid json content {")
-        temp_path = f.name
+    json_path = tmp_path / "invalid.json"
+    json_path.write_text("invalid json content {", encoding="utf-8")
     
-    try:
-        with pytest.raises(JSONLoadError):
-            loader.load_from_file(temp_path)
-    finally:
-        Path(temp_path).unlink()
+    with pytest.raises(JSONLoadError):
+        loader.load_from_file(str(json_path))
 
 
 def test_optional_fields(loader):
@@ -203,7 +196,7 @@ def test_optional_fields(loader):
         "status": "success"
     }]
     
-    records = loader.load_from_string(json.dumps(minimal_data))
+    records = loader.load_from_dicts(minimal_data)
     assert records[0].backup_type is None
     assert records[0].source_system is None
     assert records[0].metadata == {}
@@ -222,7 +215,7 @@ def test_metadata_preservation(loader):
         }
     }]
     
-    records = loader.load_from_string(json.dumps(data))
+    records = loader.load_from_dicts(data)
     assert records[0].metadata["custom_field"] == "value"
     assert records[0].metadata["nested"]["key"] == "value"
 
@@ -236,24 +229,22 @@ def test_duration_calculation(loader):
         "status": "success"
     }]
     
-    records = loader.load_from_string(json.dumps(data))
+    records = loader.load_from_dicts(data)
     assert records[0].duration == 330.0  # 5*60 + 30 seconds
 
 
-def test_multiple_status_values(loader):
+@pytest.mark.parametrize("status", ["success", "failure", "partial"])
+def test_multiple_status_values(loader, status):
     """Test all valid status values."""
-    statuses = ["success", "failure", "partial"]
+    data = [{
+        "backup_id": f"test-{status}",
+        "start_time": "2024-01-01T10:00:00Z",
+        "end_time": "2024-01-01T10:30:00Z",
+        "status": status
+    }]
     
-    for status in statuses:
-        data = [{
-            "backup_id": f"test-{status}",
-            "start_time": "2024-01-01T10:00:00Z",
-            "end_time": "2024-01-01T10:30:00Z",
-            "status": status
-        }]
-        
-        records = loader.load_from_string(json.dumps(data))
-        assert records[0].status == BackupStatus(status)
+    records = loader.load_from_dicts(data)
+    assert records[0].status == BackupStatus(status)
 
 
 def test_empty_array(loader):
@@ -280,7 +271,37 @@ def test_partial_failure_handling(loader):
     ]
     
     with pytest.raises(JSONLoadError) as exc_info:
-        loader.load_from_string(json.dumps(data))
+        loader.load_from_dicts(data)
     
     assert "Failed to normalize" in str(exc_info.value)
     assert "invalid-001" in str(exc_info.value)
+
+
+def test_backup_record_is_immutable(loader, temp_json_file):
+    """Test that loaded records cannot be modified in place."""
+    record = loader.load_from_file(temp_json_file)[0]
+    
+    with pytest.raises(ValidationError) as exc_info:
+        record.backup_type = "changed"
+    assert exc_info.value.errors()[0]["type"] == "frozen_instance"
+    
+    assert record.model_copy(update={"backup_type": "changed"}).backup_type == "changed"
+
+
+def test_categorical_fields_shared(loader):
+    """Test that repeated backup_type/source_system values share one string."""
+    data = [
+        {
+            "backup_id": f"test-{i}",
+            "start_time": "2024-01-01T10:00:00Z",
+            "end_time": "2024-01-01T10:30:00Z",
+            "status": "success",
+            "backup_type": "".join(["data", "base"]),
+            "source_system": "".join(["db", "-01"])
+        }
+        for i in range(2)
+    ]
+    
+    records = loader.load_from_dicts(data)
+    assert records[0].backup_type is records[1].backup_type
+    assert records[0].source_system is records[1].source_system
@@ -1,9 +1,9 @@
 """Tests for processing engine."""
 
 import pytest
-from datetime import date, datetime, timedelta
-import pytz
+from datetime import date, datetime, timedelta, timezone
 import calendar
+from pydantic import ValidationError
 
 from backup_monitoring.processing.processor import ProcessingEngine, ProcessingError
 from backup_monitoring.processing.models import (
@@ -15,26 +15,26 @@ from backup_monitoring.processing.models import (
 )
 from backup_monitoring.data_loader.models import BackupRecord, BackupStatus
 
+_BASE_DATE = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_records():
-    """Create sample backup records for testing."""
-    base_date = datetime(2024, 1, 1, 10, 0, 0, tzinfo=pytz.UTC)
-    
-    return [
+    """Create sample backup records for testing (shared; records are immutable)."""
+    return (
         # Day 1 - database backups
         BackupRecord(
             backup_id="backup-001",
-            start_time=base_date,
-            end_time=base_date + timedelta(minutes=30),
+            start_time=_BASE_DATE,
+            end_time=_BASE_DATE + timedelta(minutes=30),
             status=BackupStatus.SUCCESS,
             backup_type="database",
             source_system="db-01"
         ),
         BackupRecord(
             backup_id="backup-002",
-            start_time=base_date + timedelta(hours=1),
-            end_time=base_date + timedelta(hours=1, minutes=45),
+            start_time=_BASE_DATE + timedelta(hours=1),
+            end_time=_BASE_DATE + timedelta(hours=1, minutes=45),
             status=BackupStatus.SUCCESS,
             backup_type="database",
             source_system="db-01"
@@ -42,8 +42,8 @@ def sample_records():
         # Day 1 - filesystem backup
         BackupRecord(
             backup_id="backup-003",
-            start_time=base_date + timedelta(hours=2),
-            end_time=base_date + timedelta(hours=2, minutes=15),
+            start_time=_BASE_DATE + timedelta(hours=2),
+            end_time=_BASE_DATE + timedelta(hours=2, minutes=15),
             status=BackupStatus.SUCCESS,
             backup_type="filesystem",
             source_system="fs-01"
@@ -51,18 +51,18 @@ def sample_records():
         # Day 2 - database backup
         BackupRecord(
             backup_id="backup-004",
-            start_time=base_date + timedelta(days=1),
-            end_time=base_date + timedelta(days=1, minutes=20),
+            start_time=_BASE_DATE + timedelta(days=1),
+            end_time=_BASE_DATE + timedelta(days=1, minutes=20),
             status=BackupStatus.FAILURE,
             backup_type="database",
             source_system="db-01"
         ),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def processor():
-    """Create a ProcessingEngine instance."""
+    """Create a ProcessingEngine instance (shared; it holds only configuration)."""
     return ProcessingEngine()
 
 
@@ -73,12 +73,13 @@ def test_compute_daily_aggregates(processor, sample_records):
     assert len(daily_metrics) > 0
     
     # Check that we have metrics for each day/type combination
-    dates = {m.date for m in daily_metrics}
+    by_key = {(m.date, m.backup_type): m for m in daily_metrics}
+    dates = {day for day, _ in by_key}
     assert date(2024, 1, 1) in dates
     assert date(2024, 1, 2) in dates
     
     # Check database metrics for day 1
-    day1_db = next((m for m in daily_metrics if m.date == date(2024, 1, 1) and m.backup_type == "database"), None)
+    day1_db = by_key.get((date(2024, 1, 1), "database"))
     assert day1_db is not None
     assert day1_db.total_count == 2
     assert day1_db.success_count == 2
@@ -107,8 +108,8 @@ def test_compute_daily_aggregates_single_record(processor):
     """Test daily aggregate computation with single record."""
     record = BackupRecord(
         backup_id="single",
-        start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=pytz.UTC),
-        end_time=datetime(2024, 1, 1, 10, 30, 0, tzinfo=pytz.UTC),
+        start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
+        end_time=datetime(2024, 1, 1, 10, 30, 0, tzinfo=timezone.utc),
         status=BackupStatus.SUCCESS,
         backup_type="database"
     )
@@ -180,13 +181,11 @@ def test_compute_monthly_aggregates_empty_list(processor):
 
 def test_status_counting(processor):
     """Test that status counting works correctly."""
-    base_date = datetime(2024, 1, 1, 10, 0, 0, tzinfo=pytz.UTC)
-    
     records = [
         BackupRecord(
             backup_id=f"backup-{i}",
-            start_time=base_date + timedelta(hours=i),
-            end_time=base_date + timedelta(hours=i, minutes=30),
+            start_time=_BASE_DATE + timedelta(hours=i),
+            end_time=_BASE_DATE + timedelta(hours=i, minutes=30),
             status=status,
             backup_type="database"
         )
@@ -212,27 +211,25 @@ def test_status_counting(processor):
 
 def test_duration_calculations(processor):
     """Test that duration calculations are correct."""
-    base_date = datetime(2024, 1, 1, 10, 0, 0, tzinfo=pytz.UTC)
-    
     records = [
         BackupRecord(
             backup_id="backup-001",
-            start_time=base_date,
-            end_time=base_date + timedelta(minutes=10),  # 10 minutes
+            start_time=_BASE_DATE,
+            end_time=_BASE_DATE + timedelta(minutes=10),  # 10 minutes
             status=BackupStatus.SUCCESS,
             backup_type="database"
         ),
         BackupRecord(
             backup_id="backup-002",
-            start_time=base_date + timedelta(hours=1),
-            end_time=base_date + timedelta(hours=1, minutes=30),  # 30 minutes
+            start_time=_BASE_DATE + timedelta(hours=1),
+            end_time=_BASE_DATE + timedelta(hours=1, minutes=30),  # 30 minutes
             status=BackupStatus.SUCCESS,
             backup_type="database"
         ),
         BackupRecord(
             backup_id="backup-003",
-            start_time=base_date + timedelta(hours=2),
-            end_time=base_date + timedelta(hours=2, minutes=5),  # 5 minutes
+            start_time=_BASE_DATE + timedelta(hours=2),
+            end_time=_BASE_DATE + timedelta(hours=2, minutes=5),  # 5 minutes
             status=BackupStatus.SUCCESS,
             backup_type="database"
         ),
@@ -250,20 +247,18 @@ def test_duration_calculations(processor):
 
 def test_multiple_backup_types(processor):
     """Test aggregation with multiple backup types."""
-    base_date = datetime(2024, 1, 1, 10, 0, 0, tzinfo=pytz.UTC)
-    
     records = [
         BackupRecord(
             backup_id="db-001",
-            start_time=base_date,
-            end_time=base_date + timedelta(minutes=30),
+            start_time=_BASE_DATE,
+            end_time=_BASE_DATE + timedelta(minutes=30),
             status=BackupStatus.SUCCESS,
             backup_type="database"
         ),
         BackupRecord(
             backup_id="fs-001",
-            start_time=base_date + timedelta(hours=1),
-            end_time=base_date + timedelta(hours=1, minutes=15),
+            start_time=_BASE_DATE + timedelta(hours=1),
+            end_time=_BASE_DATE + timedelta(hours=1, minutes=15),
             status=BackupStatus.SUCCESS,
             backup_type="filesystem"
         ),
@@ -274,22 +269,19 @@ def test_multiple_backup_types(processor):
     # Should have separate metrics for each backup type
     assert len(daily_metrics) == 2
     
-    db_metrics = next(m for m in daily_metrics if m.backup_type == "database")
-    fs_metrics = next(m for m in daily_metrics if m.backup_type == "filesystem")
+    by_type = {m.backup_type: m for m in daily_metrics}
     
-    assert db_metrics.total_count == 1
-    assert fs_metrics.total_count == 1
+    assert by_type["database"].total_count == 1
+    assert by_type["filesystem"].total_count == 1
 
 
 def test_unknown_backup_type(processor):
     """Test aggregation with unknown/null backup type."""
-    base_date = datetime(2024, 1, 1, 10, 0, 0, tzinfo=pytz.UTC)
-    
     records = [
         BackupRecord(
             backup_id="unknown-001",
-            start_time=base_date,
-            end_time=base_date + timedelta(minutes=30),
+            start_time=_BASE_DATE,
+            end_time=_BASE_DATE + timedelta(minutes=30),
             status=BackupStatus.SUCCESS,
             backup_type=None  # No backup type
         ),
@@ -328,47 +320,49 @@ def test_week_start_calculation(processor):
     assert processor._get_week_start(sunday) == monday
 
 
-def test_month_end_calculation(processor):
+@pytest.mark.parametrize("month", range(1, 13))
+@pytest.mark.parametrize("year", [
+    2023,
+    2024,  # Leap year
+    1900,  # Divisible by 100 only: not a leap year
+    2000,  # Divisible by 400: leap year
+])
+def test_month_end_calculation(processor, year, month):
     """Test that month end calculation handles different month lengths."""
-    # Create records for different months to test month end calculation
-    jan_record = BackupRecord(
-        backup_id="jan-001",
-        start_time=datetime(2024, 1, 15, 10, 0, 0, tzinfo=pytz.UTC),
-        end_time=datetime(2024, 1, 15, 10, 30, 0, tzinfo=pytz.UTC),
-        status=BackupStatus.SUCCESS,
-        backup_type="database"
-    )
+    expected_last_day = calendar.monthrange(year, month)[1]
     
-    feb_record = BackupRecord(
-        backup_id="feb-001",
-        start_time=datetime(2024, 2, 15, 10, 0, 0, tzinfo=pytz.UTC),
-        end_time=datetime(2024, 2, 15, 10, 30, 0, tzinfo=pytz.UTC),
+    record = BackupRecord(
+        backup_id=f"{year}-{month:02d}-001",
+        start_time=datetime(year, month, 15, 10, 0, 0, tzinfo=timezone.utc),
+        end_time=datetime(year, month, 15, 10, 30, 0, tzinfo=timezone.utc),
         status=BackupStatus.SUCCESS,
         backup_type="database"
     )
     
-    apr_record = BackupRecord(
-        backup_id="apr-001",
-        start_time=datetime(2024, 4, 15, 10, 0, 0, tzinfo=pytz.UTC),
-        end_time=datetime(2024, 4, 15, 10, 30, 0, tzinfo=pytz.UTC),
-        status=BackupStatus.SUCCESS,
-        backup_type="database"
+    monthly_metrics = processor.compute_monthly_aggregates([record], year=year, month=month)
+    assert len(monthly_metrics) > 0
+    assert monthly_metrics[0].period_end.day == expected_last_day
+
+
+def test_daily_metrics_date_field_is_a_date():
+    """Test that DailyMetrics.date is typed as a date rather than its own field default."""
+    assert DailyMetrics.model_fields["date"].annotation is date
+    
+    metrics = DailyMetrics(
+        period_start=date(2024, 1, 1),
+        period_end=date(2024, 1, 1),
+        backup_type="database",
+        date="2024-01-01",
+        average_duration=0.0,
+        max_duration=0.0,
+        min_duration=0.0,
+        total_duration=0.0,
+        total_count=0,
+        success_count=0,
+        failure_count=0,
+        partial_count=0,
     )
-    
-    # January has 31 days
-    jan_metrics = processor.compute_monthly_aggregates([jan_record], year=2024, month=1)
-    assert len(jan_metrics) > 0
-    assert jan_metrics[0].period_end.day == 31
-    
-    # February 2024 has 29 days (leap year)
-    feb_metrics = processor.compute_monthly_aggregates([feb_record], year=2024, month=2)
-    assert len(feb_metrics) > 0
-    assert feb_metrics[0].period_end.day == 29
-    
-    # April has 30 days
-    apr_metrics = processor.compute_monthly_aggregates([apr_record], year=2024, month=4)
-    assert len(apr_metrics) > 0
-    assert apr_metrics[0].period_end.day == 30
+    assert metrics.date == date(2024, 1, 1)
 
 
 def test_metrics_properties(processor, sample_records):
@@ -383,3 +377,55 @@ def test_metrics_properties(processor, sample_records):
         assert metric.max_duration >= metric.min_duration
         assert 0 <= metric.success_rate <= 100
         assert 0 <= metric.failure_rate <= 100
+
+
+def test_metric_values_cached_and_reset_on_copy(processor, sample_records):
+    """Test that cached metric values follow field updates made through model_copy."""
+    metric = processor.compute_daily_aggregates(sample_records)[0]
+    
+    values = metric.metric_values
+    assert metric.metric_values is values
+    assert values["total_count"] == float(metric.total_count)
+    assert values["success_rate"] == metric.success_rate
+    
+    updated = metric.model_copy(update={"total_count": metric.total_count + 1})
+    assert updated.metric_values["total_count"] == float(metric.total_count + 1)
+    assert metric.model_copy().metric_values == values
+
+
+def test_metric_values_cache_ignored_by_equality(processor, sample_records):
+    """Test that reading cached metric values does not affect model equality."""
+    metric = processor.compute_daily_aggregates(sample_records)[0]
+    fresh = processor.compute_daily_aggregates(sample_records)[0]
+    
+    metric.metric_values
+    
+    assert metric == fresh
+    assert fresh == metric
+
+
+def test_rates_recomputed_on_copy(processor, sample_records):
+    """Test that cached rates are recomputed for copies with updated counts."""
+    metric = processor.compute_daily_aggregates(sample_records)[0]
+    assert metric.success_rate == metric.success_count / metric.total_count * 100.0
+    
+    updated = metric.model_copy(update={"total_count": 0})
+    assert updated.success_rate == 0.0
+    assert updated.failure_rate == 0.0
+    
+    with pytest.raises(ValidationError) as exc_info:
+        metric.total_count = 0
+    assert exc_info.value.errors()[0]["type"] == "frozen_instance"
+
+
+def test_rates_cache_ignored_by_equality_and_copy(processor, sample_records):
+    """Test that a copy equals its source after a rate has been read."""
+    metric = processor.compute_daily_aggregates(sample_records)[0]
+    
+    metric.success_rate
+    metric.failure_rate
+    
+    assert metric == metric.model_copy()
+    assert metric.model_copy() == metric
+    assert metric == metric.model_copy(deep=True)
+    assert "success_rate" not in metric.model_copy().__dict__
@@ -14,30 +14,43 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root / "src"))
 
+_REQUIRED_PATHS = (
+    "src/backup_monitoring/__init__.py",
+    "src/backup_monitoring/config/config_loader.py",
+    "src/backup_monitoring/data_loader/__init__.py",
+    "src/backup_monitoring/classifier/__init__.py",
+    "src/backup_monitoring/processing/__init__.py",
+    "src/backup_monitoring/anomaly_detection/__init__.py",
+    "src/backup_monitoring/reporting/__init__.py",
+    "src/backup_monitoring/integration/__init__.py",
+    "src/tests/__init__.py",
+    "config/config.yaml",
+    "config/classification_rules.yaml",
+    "config/json_schema.json",
+    "pyproject.toml",
+    "requirements.txt",
+    "README.md",
+)
+
+_REQUIRED_MODULES = (
+    "backup_monitoring",
+    "backup_monitoring.config",
+    "backup_monitoring.config.config_loader",
+    "backup_monitoring.data_loader",
+    "backup_monitoring.classifier",
+    "backup_monitoring.processing",
+    "backup_monitoring.anomaly_detection",
+    "backup_monitoring.reporting",
+    "backup_monitoring.integration",
+)
+
+
 def validate_project_structure():
     """Validate that all required directories and files exist."""
     print("Validating project structure...")
     
-    required_paths = [
-        "src/backup_monitoring/__init__.py",
-        "src/backup_monitoring/config/config_loader.py",
-        "src/backup_monitoring/data_loader/__init__.py",
-        "src/backup_monitoring/classifier/__init__.py",
-        "src/backup_monitoring/processing/__init__.py",
-        "src/backup_monitoring/anomaly_detection/__init__.py",
-        "src/backup_monitoring/reporting/__init__.py",
-        "src/backup_monitoring/integration/__init__.py",
-        "src/tests/__init__.py",
-        "config/config.yaml",
-        "config/classification_rules.yaml",
-        "config/json_schema.json",
-        "pyproject.toml",
-        "requirements.txt",
-        "README.md",
-    ]
-    
     missing = []
-    for path in required_paths:
+    for path in _REQUIRED_PATHS:
         full_path = project_root / path
         if not full_path.exists():
             missing.append(path)
@@ -90,20 +103,8 @@ def validate_imports():
     """Validate that all modules can be imported."""
     print("\nValidating module imports...")
     
-    modules = [
-        "backup_monitoring",
-        "backup_monitoring.config",
-        "backup_monitoring.config.config_loader",
-        "backup_monitoring.data_loader",
-        "backup_monitoring.classifier",
-        "backup_monitoring.processing",
-        "backup_monitoring.anomaly_detection",
-        "backup_monitoring.reporting",
-        "backup_monitoring.integration",
-    ]
-    
     failed = []
-    for module in modules:
+    for module in _REQUIRED_MODULES:
         try:
             __import__(module)
             print(f"   ✅ {module}")